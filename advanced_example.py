@@ -29,11 +29,16 @@ class AdvancedSlackMonitor(SlackMonitor):
         super().__init__(**kwargs)
         self.db_path = db_path
         self.enable_notifications = enable_notifications
+        # One connection for the monitor's lifetime instead of connect/close per call
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("PRAGMA temp_store=MEMORY")
         self._init_database()
 
     def _init_database(self):
         """Initialize SQLite database for message history"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -60,29 +65,34 @@ class AdvancedSlackMonitor(SlackMonitor):
             )
         """)
 
+        # get_recent_stats reads importance for a checked_at range; covering it
+        # turns the full table scan into an index range scan
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_messages_checked_importance
+            ON messages(checked_at, importance)
+        """)
+
         conn.commit()
-        conn.close()
+
+    def close(self):
+        """Close the database connection"""
+        self._db.close()
 
     def _save_message(self, message: SlackMessage):
         """Save message to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO messages
-            (channel, user, text, timestamp, importance, reason)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            message.channel,
-            message.user,
-            message.text,
-            message.timestamp,
-            message.importance,
-            message.reason
-        ))
-
-        conn.commit()
-        conn.close()
+        with self._db:
+            self._db.execute("""
+                INSERT INTO messages
+                (channel, user, text, timestamp, importance, reason)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (
+                message.channel,
+                message.user,
+                message.text,
+                message.timestamp,
+                message.importance,
+                message.reason
+            ))
 
     def _send_desktop_notification(self, title: str, message: str):
         """Send desktop notification (platform-specific)"""
@@ -111,20 +121,21 @@ class AdvancedSlackMonitor(SlackMonitor):
         critical = [m for m in messages if m.importance == "CRITICAL"]
         important = [m for m in messages if m.importance == "IMPORTANT"]
 
-        # Save to database
-        for msg in messages:
-            self._save_message(msg)
-
-        # Save check history
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO check_history
-            (messages_found, critical_count, important_count)
-            VALUES (?, ?, ?)
-        """, (len(messages), len(critical), len(important)))
-        conn.commit()
-        conn.close()
+        # Save messages and check history in one transaction (single commit)
+        with self._db:
+            self._db.executemany("""
+                INSERT INTO messages
+                (channel, user, text, timestamp, importance, reason)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, [
+                (msg.channel, msg.user, msg.text, msg.timestamp, msg.importance, msg.reason)
+                for msg in messages
+            ])
+            self._db.execute("""
+                INSERT INTO check_history
+                (messages_found, critical_count, important_count)
+                VALUES (?, ?, ?)
+            """, (len(messages), len(critical), len(important)))
 
         # Send notifications for critical messages
         if critical:
@@ -137,8 +148,7 @@ class AdvancedSlackMonitor(SlackMonitor):
 
     def get_recent_stats(self, hours: int = 24) -> Dict[str, Any]:
         """Get statistics for recent messages"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._db.cursor()
 
         cursor.execute("""
             SELECT
@@ -151,7 +161,7 @@ class AdvancedSlackMonitor(SlackMonitor):
         """, (hours,))
 
         result = cursor.fetchone()
-        conn.close()
+        cursor.close()
 
         return {
             "total": result[0] or 0,
@@ -257,17 +267,23 @@ async def example_advanced_monitor():
 
         # Get statistics
         stats = monitor.get_recent_stats(hours=24)
-        print(f"\n📊 Last 24 hours:")
-        print(f"   Total messages: {stats['total']}")
-        print(f"   Critical: {stats['critical']}")
-        print(f"   Important: {stats['important']}")
-        print(f"   Normal: {stats['normal']}")
+        total, critical, important, normal = (
+            stats["total"], stats["critical"], stats["important"], stats["normal"]
+        )
+        print(
+            f"\n📊 Last 24 hours:\n"
+            f"   Total messages: {total}\n"
+            f"   Critical: {critical}\n"
+            f"   Important: {important}\n"
+            f"   Normal: {normal}"
+        )
 
         # Or run continuously
         # await monitor.monitor_continuously()
 
     finally:
         await monitor.disconnect()
+        monitor.close()
 
 
 async def example_multi_workspace():
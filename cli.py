@@ -19,9 +19,16 @@ except ImportError:
 
 try:
     from dotenv import load_dotenv
-    load_dotenv()
 except ImportError:
     pass
+else:
+    # The .env next to the script is loaded directly; only without one fall back to
+    # the no-argument form, which walks up the directory tree via find_dotenv
+    _env_path = Path(__file__).parent / ".env"
+    if _env_path.exists():
+        load_dotenv(_env_path)
+    else:
+        load_dotenv()
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -15,6 +15,7 @@ from typing import Any, Dict, List, Optional
 
 from monitoring.configuration import ConfigurationError, load_runtime_config
 from monitoring.models import RuntimeConfig
+from monitoring.utils import find_keyword
 
 
 class Config:
@@ -24,6 +25,22 @@ class Config:
         self.config_file = config_file
         self.runtime: RuntimeConfig = load_runtime_config(config_file)
 
+        # The runtime config is immutable once loaded, so derive the lookup
+        # tables the legacy helpers need once instead of on every call.
+        self._channel_aliases: Dict[str, str] = {rule.id: rule.label for rule in self.runtime.channels}
+        self._channel_rules: Dict[str, Dict[str, Any]] = {}
+        for rule in reversed(self.runtime.channels):
+            legacy_rule = {
+                "alias": rule.label,
+                "recurrence_threshold": rule.recurrence_threshold,
+                "importance_hint": rule.severity_hint.value,
+                "patterns_to_watch": rule.critical_keywords,
+                "ignore_patterns": rule.ignore_patterns,
+            }
+            # Reversed so the first matching rule wins, as with the old linear scan
+            self._channel_rules[rule.label] = legacy_rule
+            self._channel_rules[rule.id] = legacy_rule
+
     # ------------------------------------------------------------------
     # Legacy-style helpers (used by slack_monitor_yaml.py)
     # ------------------------------------------------------------------
@@ -72,22 +89,16 @@ class Config:
 
     @property
     def channel_aliases(self) -> Dict[str, str]:
-        return {rule.id: rule.label for rule in self.runtime.channels}
+        return dict(self._channel_aliases)
 
     def resolve_channel_label(self, channel_id: str) -> str:
-        label = self.channel_aliases.get(channel_id, channel_id)
+        label = self._channel_aliases.get(channel_id, channel_id)
         return f"{label} ({channel_id})"
 
     def get_channel_rule(self, channel: str) -> Dict[str, Any]:
-        for rule in self.runtime.channels:
-            if rule.id == channel or rule.label == channel.lstrip("#"):
-                return {
-                    "alias": rule.label,
-                    "recurrence_threshold": rule.recurrence_threshold,
-                    "importance_hint": rule.severity_hint.value,
-                    "patterns_to_watch": rule.critical_keywords,
-                    "ignore_patterns": rule.ignore_patterns,
-                }
+        rule = self._channel_rules.get(channel) or self._channel_rules.get(channel.lstrip("#"))
+        if rule is not None:
+            return dict(rule)
         return {
             "alias": channel,
             "recurrence_threshold": 3,
@@ -98,10 +109,9 @@ class Config:
 
     def should_ignore_pattern(self, channel_name: str, text: str) -> tuple[bool, str]:
         rule = self.get_channel_rule(channel_name)
-        text_lower = text.lower()
-        for pattern in rule.get("ignore_patterns", []):
-            if pattern.lower() in text_lower:
-                return True, f"Matches ignore pattern: {pattern}"
+        pattern = find_keyword(rule.get("ignore_patterns", []), text)
+        if pattern is not None:
+            return True, f"Matches ignore pattern: {pattern}"
         return False, ""
 
 
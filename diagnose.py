@@ -38,7 +38,7 @@ def check_requirement(name, check_func, fix_hint):
 def check_python():
     """Check Python version"""
     version = sys.version.split()[0]
-    if sys.version_info >= (3, 8):
+    if sys.version_info >= (3, 11):
         return f"Python {version}"
     return False
 
@@ -204,7 +204,7 @@ def main():
     print("="*70 + "\n")
 
     checks = [
-        ("Python version (≥3.8)", check_python, "Install Python 3.8+"),
+        ("Python version (≥3.11)", check_python, "Install Python 3.11+"),
         ("Virtual environment", check_venv, "Run: source venv/bin/activate"),
         ("Node.js", check_nodejs, "Install Node.js: https://nodejs.org/"),
         ("npm", check_npm, "Install npm (comes with Node.js)"),
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Mapping, Optional, Tuple
 
 from .models import (
     AlertDecision,
@@ -12,9 +13,12 @@ from .models import (
     SeverityLevel,
 )
 from .storage import AlertStore
-from .utils import compute_content_hash, normalize_text
+from .utils import compute_content_hash, find_keyword, normalize_text
 
 
+# Keyword scan results remembered per content hash (repeat alerts skip the rule scan)
+_KEYWORD_CACHE_MAX = 4096
+
 @dataclass
 class ClassificationContext:
     """Contextual information produced during classification."""
@@ -31,42 +35,60 @@ class HeuristicClassifier:
     def __init__(self, store: AlertStore, config: RealtimeMonitorConfig):
         self.store = store
         self.config = config
-
-    def classify(self, channel_rule: ChannelRule, message_text: str) -> tuple[AlertDecision, ClassificationContext]:
+        # content_hash -> (ignore pattern, critical keyword). The hash covers the
+        # normalized lowercase text and the channel ID, and channel rules are fixed
+        # for the lifetime of the config, so a hit gives the same answer as a rescan.
+        self._keyword_cache: "OrderedDict[str, Tuple[Optional[str], Optional[str]]]" = OrderedDict()
+
+    def classify(
+        self,
+        channel_rule: ChannelRule,
+        message_text: str,
+        pending_occurrences: Optional[Mapping[str, int]] = None,
+        stored_counts: Optional[Dict[str, int]] = None,
+        content_hash: Optional[str] = None,
+    ) -> tuple[AlertDecision, ClassificationContext]:
+        """Classify a message.
+
+        ``pending_occurrences`` counts hashes classified but not yet stored.
+        ``stored_counts`` memoizes the stored recurrence count per hash while
+        nothing is written (e.g. across one page), so repeats skip the query.
+        ``content_hash`` is the message's ``content_hash()``, if already computed.
+        """
         text = normalize_text(message_text)
-        text_lower = text.lower()
+        if content_hash is None:
+            # Normalize and lowercase once; the hash reuses this instead of redoing both
+            content_hash = compute_content_hash(text.lower(), extra_keys=[channel_rule.id], normalized=True)
 
-        content_hash = compute_content_hash(text, extra_keys=[channel_rule.id])
+        pattern, matched_keyword = self._match_keywords(channel_rule, text, content_hash)
 
         # Check ignore patterns first
-        for pattern in channel_rule.ignore_patterns:
-            pattern_lower = pattern.lower()
-            if pattern_lower and pattern_lower in text_lower:
-                decision = AlertDecision(
-                    severity=SeverityLevel.IGNORE,
-                    reason=f"Ignored due to pattern '{pattern}'",
-                    notify=False,
-                )
-                context = ClassificationContext(content_hash=content_hash, recurrence_count=0, ignored_pattern=pattern)
-                return decision, context
+        if pattern is not None:
+            decision = AlertDecision(
+                severity=SeverityLevel.IGNORE,
+                reason=f"Ignored due to pattern '{pattern}'",
+                notify=False,
+            )
+            context = ClassificationContext(content_hash=content_hash, recurrence_count=0, ignored_pattern=pattern)
+            return decision, context
 
         severity = channel_rule.severity_hint
         reason_parts = [f"Base severity {severity.value} (channel hint)"]
-        matched_keyword: Optional[str] = None
-
-        for keyword in channel_rule.critical_keywords:
-            keyword_lower = keyword.lower()
-            if keyword_lower and keyword_lower in text_lower:
-                severity = SeverityLevel.CRITICAL
-                matched_keyword = keyword
-                reason_parts.append(f"Matched critical keyword '{keyword}'")
-                break
+        if matched_keyword is not None:
+            severity = SeverityLevel.CRITICAL
+            reason_parts.append(f"Matched critical keyword '{matched_keyword}'")
 
         # Recurrence logic uses count of existing alerts with same hash
-        prior_occurrences = self.store.count_recent_occurrences(
-            content_hash,
-            window_minutes=self.config.duplicate_window_minutes,
-        )
+        prior_occurrences = stored_counts.get(content_hash) if stored_counts is not None else None
+        if prior_occurrences is None:
+            prior_occurrences = self.store.count_recent_occurrences(
+                content_hash,
+                window_minutes=self.config.duplicate_window_minutes,
+            )
+            if stored_counts is not None:
+                stored_counts[content_hash] = prior_occurrences
+        if pending_occurrences:
+            prior_occurrences += pending_occurrences.get(content_hash, 0)
 
         recurrence_threshold = max(1, channel_rule.recurrence_threshold)
         if prior_occurrences + 1 >= recurrence_threshold and severity != SeverityLevel.CRITICAL:
@@ -90,3 +112,26 @@ class HeuristicClassifier:
             matched_keyword=matched_keyword,
         )
         return decision, context
+
+    @staticmethod
+    def content_hash(channel_rule: ChannelRule, message_text: str) -> str:
+        """Return the hash ``classify`` assigns to ``message_text`` (for prefetching counts)."""
+        return compute_content_hash(
+            normalize_text(message_text).lower(), extra_keys=[channel_rule.id], normalized=True
+        )
+
+    def _match_keywords(
+        self, channel_rule: ChannelRule, text: str, content_hash: str
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Return (ignore pattern, critical keyword) found in text, memoized per content hash."""
+        cached = self._keyword_cache.get(content_hash)
+        if cached is not None:
+            self._keyword_cache.move_to_end(content_hash)
+            return cached
+        ignored = find_keyword(channel_rule.ignore_patterns, text)
+        # Ignored messages never reach the critical keyword check
+        matched = None if ignored is not None else find_keyword(channel_rule.critical_keywords, text)
+        self._keyword_cache[content_hash] = (ignored, matched)
+        if len(self._keyword_cache) > _KEYWORD_CACHE_MAX:
+            self._keyword_cache.popitem(last=False)
+        return ignored, matched
@@ -4,11 +4,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+import copy
 import os
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from .models import (
     ChannelRule,
     DigestConfig,
@@ -25,6 +31,14 @@ class ConfigurationError(RuntimeError):
     """Raised when the configuration file is invalid."""
 
 
+class ConfigurationNotFoundError(ConfigurationError, FileNotFoundError):
+    """Raised when the configuration file does not exist."""
+
+
+# Resolved path -> (mtime_ns, size, parsed YAML); reparsed only when the file changes
+_YAML_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
 def _resolve_env(value: Optional[str]) -> Optional[str]:
     """Support ${ENV_VAR} references in YAML values."""
     if value is None or not isinstance(value, str):
@@ -87,13 +101,24 @@ def _parse_notification_config(data: Optional[Dict[str, Any]]) -> NotificationCo
 
 
 def _load_yaml(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        raise ConfigurationError(f"Configuration file not found: {path}")
-    with path.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise ConfigurationNotFoundError(f"Configuration file not found: {path}") from None
+
+    key = str(path.resolve())
+    cached = _YAML_CACHE.get(key)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        # Callers mutate nested sections while parsing, so hand out a copy
+        return copy.deepcopy(cached[2])
+
+    # Raw bytes let libyaml detect the encoding itself instead of going through a text decoder
+    with path.open("rb") as handle:
+        data = yaml.load(handle, Loader=_YamlLoader) or {}
     if not isinstance(data, dict):
         raise ConfigurationError("Configuration root must be a YAML mapping.")
-    return data
+    _YAML_CACHE[key] = (stat.st_mtime_ns, stat.st_size, data)
+    return copy.deepcopy(data)
 
 
 def _load_bot_token(slack_section: Dict[str, Any]) -> str:
@@ -234,6 +259,7 @@ def load_runtime_config(path: str | Path = "config.yaml") -> RuntimeConfig:
         llm=_parse_llm_config(realtime_section.get("llm")),
         lookback_minutes=int(realtime_section.get("lookback_minutes", 60)),
         duplicate_window_minutes=int(realtime_section.get("duplicate_window_minutes", 60)),
+        retention_days=int(realtime_section.get("retention_days", 0)),
     )
 
     digest_section = raw.get("digest", {})
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timezone
-from typing import List, Optional
+from itertools import islice
+from typing import List, Optional, Tuple
 
 from .configuration import load_runtime_config
 from .llm import LLMClient, LLMInvocationError
@@ -27,12 +28,30 @@ class DigestGenerator:
         if config.digest.llm.enabled:
             self.llm_client = LLMClient(config.digest.llm)
 
+    async def aclose(self) -> None:
+        """Release the SQLite connection held by the alert store."""
+        self.store.close()
+
     def build_digest_message(self, lookback_minutes: int, include_filtered: bool) -> str:
-        alerts = self.store.fetch_recent_alerts(
+        return self._compose_digest(lookback_minutes, include_filtered)[0]
+
+    def _compose_digest(self, lookback_minutes: int, include_filtered: bool) -> Tuple[str, int]:
+        """Return the digest text and how many alerts it covers."""
+        # Tallies are aggregated in SQL; only the highlighted alerts are read back
+        counts = self.store.count_recent_alerts(
             lookback_minutes=lookback_minutes,
             include_filtered=include_filtered,
             min_severity=SeverityLevel.NORMAL,
         )
+        recent = self.store.iter_recent_alerts(
+            lookback_minutes,
+            include_filtered=include_filtered,
+            min_severity=SeverityLevel.NORMAL,
+        )
+        try:
+            alerts = list(islice(recent, self.config.digest.lookback_minutes // 5 or 5))
+        finally:
+            recent.close()
         now_local = datetime.now(timezone.utc)
         header_time = now_local.strftime("%d/%m %H:%M")
 
@@ -41,11 +60,11 @@ class DigestGenerator:
             f"Período analisado: últimas {lookback_minutes} minutos",
         ]
 
-        total = len(alerts)
-        sent = sum(1 for alert in alerts if alert.sent_to_slack)
+        total = counts["total"]
+        sent = counts["sent"]
+        critical = counts["critical"]
+        important = counts["important"]
         filtered = total - sent
-        critical = sum(1 for alert in alerts if alert.importance == SeverityLevel.CRITICAL)
-        important = sum(1 for alert in alerts if alert.importance == SeverityLevel.IMPORTANT)
 
         lines.append(f"Total de alertas registrados: {total} (notificados: {sent} | filtrados: {filtered})")
 
@@ -61,7 +80,7 @@ class DigestGenerator:
 
         if alerts:
             lines.append("\n📌 Destaques:")
-            for alert in alerts[: self.config.digest.lookback_minutes // 5 or 5]:
+            for alert in alerts:
                 timestamp = alert.event_ts or alert.detected_at
                 time_str = timestamp.astimezone(timezone.utc).strftime("%H:%M")
                 status_icon = "✅" if alert.sent_to_slack else "⏳"
@@ -76,16 +95,20 @@ class DigestGenerator:
             lines.append("\n✅ Nenhum alerta relevante registrado no período.")
 
         lines.append("\n_Monitor em modo resumo periódico_")
-        return "\n".join(lines)
+        return "\n".join(lines), total
 
     async def send_digest(self) -> None:
         digest_cfg: DigestConfig = self.config.digest
         if not digest_cfg.enabled:
             return
 
-        message = self.build_digest_message(digest_cfg.lookback_minutes, digest_cfg.include_filtered)
+        # The alert query runs in a worker thread so the event loop stays responsive
+        message, total = await asyncio.to_thread(
+            self._compose_digest, digest_cfg.lookback_minutes, digest_cfg.include_filtered
+        )
 
-        if self.llm_client:
+        # A quiet period has nothing for the LLM to summarize; skip the round trip
+        if self.llm_client and total:
             try:
                 llm_summary = await self.llm_client.invoke(
                     "Resuma em PT-BR as informações principais:\n\n" + message
@@ -102,20 +125,30 @@ class DigestGenerator:
             await self.notifier.send_whatsapp_message(message)
 
 
-async def run_digest(config_path: str = "config.yaml", once: bool = False) -> None:
-    """Run digest generator once or in a loop."""
-    config = load_runtime_config(config_path)
+async def run_digest(
+    config_path: str = "config.yaml",
+    once: bool = False,
+    config: Optional[RuntimeConfig] = None,
+) -> None:
+    """Run digest generator once or in a loop; ``config`` skips reloading the file."""
+    config = config or load_runtime_config(config_path)
     if not config.digest.enabled:
         print("Digest generator disabled in configuration.")
         return
 
     generator = DigestGenerator(config)
 
-    if once:
-        await generator.send_digest()
-        return
+    try:
+        if once:
+            await generator.send_digest()
+        else:
+            await _run_digest_loop(generator, config)
+    finally:
+        await generator.aclose()
+
 
-    # Run periodically
+async def _run_digest_loop(generator: DigestGenerator, config: RuntimeConfig) -> None:
+    """Send digests periodically until cancelled."""
     interval_seconds = config.digest.interval_minutes * 60
     print(f"📰 Digest generator running every {config.digest.interval_minutes} minutes")
 
@@ -127,9 +160,14 @@ async def run_digest(config_path: str = "config.yaml", once: bool = False) -> No
         except Exception as error:
             print(f"❌ Failed to send initial digest: {error}")
 
-    # Main loop
+    # Main loop: fixed schedule on the monotonic clock, so send time does not
+    # accumulate as drift and wall-clock adjustments cannot shift the cadence
+    loop = asyncio.get_running_loop()
+    next_run = loop.time() + interval_seconds
     while True:
-        await asyncio.sleep(interval_seconds)
+        await asyncio.sleep(max(0.0, next_run - loop.time()))
+        # Skip slots missed while a slow send was running instead of bursting
+        next_run += interval_seconds * max(1, int((loop.time() - next_run) // interval_seconds) + 1)
         try:
             await generator.send_digest()
             print(f"✅ Digest sent at {datetime.now(timezone.utc).strftime('%H:%M:%S')}")
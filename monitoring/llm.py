@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import json
-from typing import Optional
+import re
+from typing import Dict, Optional, Sequence, Tuple
 
 import httpx
 
 from .models import LLMConfig
 
 
+# One "<n>: SEVERITY" line per alert in a batch triage reply
+_BATCH_VERDICT_RE = re.compile(r"^\s*(\d+)\s*[:.)-]\s*(CRITICAL|IMPORTANT|NORMAL|IGNORE)\b", re.IGNORECASE | re.MULTILINE)
+
+
 class LLMInvocationError(RuntimeError):
     """Raised when the LLM invocation fails."""
 
@@ -65,3 +70,23 @@ def render_triage_prompt(message_text: str, channel_label: str, recurrence_count
         f"Ocorrências recentes: {recurrence_count}\n"
         f"Mensagem: {message_text}\n"
     )
+
+
+def render_batch_triage_prompt(channel_label: str, alerts: Sequence[Tuple[str, int]]) -> str:
+    """Prompt asking for the severity of several ``(message_text, recurrence_count)`` alerts at once."""
+    lines = [
+        "Analise rapidamente os alertas abaixo. Para CADA alerta responda uma linha no formato "
+        "'<número>: <SEVERIDADE>', usando APENAS CRITICAL, IMPORTANT, NORMAL ou IGNORE.\n",
+        f"Canal: {channel_label}\n",
+    ]
+    for index, (message_text, recurrence_count) in enumerate(alerts, start=1):
+        lines.append(f"{index}. Ocorrências recentes: {recurrence_count}\n   Mensagem: {message_text}")
+    return "\n".join(lines) + "\n"
+
+
+def parse_batch_triage_response(response: str) -> Dict[int, str]:
+    """Map each 1-based alert number in a batch triage reply to its upper-case severity."""
+    verdicts: Dict[int, str] = {}
+    for number, severity in _BATCH_VERDICT_RE.findall(response):
+        verdicts.setdefault(int(number), severity.upper())
+    return verdicts
@@ -85,6 +85,7 @@ class RealtimeMonitorConfig:
     llm: LLMConfig = field(default_factory=LLMConfig)
     lookback_minutes: int = 60
     duplicate_window_minutes: int = 60
+    retention_days: int = 0
 
 
 @dataclass
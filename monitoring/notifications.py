@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 import os
+import re
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -14,6 +15,12 @@ from .models import NotificationConfig, SlackConfig
 from .slack_client import SlackClientWrapper
 
 
+# Fields scraped from a curl-based WhatsApp (Twilio) service script
+_TWILIO_ACCOUNT_RE = re.compile(r"Accounts/([A-Za-z0-9]+)/Messages")
+_TWILIO_FIELD_RE = re.compile(r"--data-urlencode '(To|From|ContentSid)=([^']+)'")
+_TWILIO_CREDENTIALS_RE = re.compile(r"-u\s+([A-Za-z0-9]+):([^\\s]+)")
+
+
 class NotificationManager:
     """Aggregate all outbound notification mechanisms."""
 
@@ -150,27 +157,22 @@ class NotificationManager:
         except OSError:
             return result
 
-        import re
-
-        match_account = re.search(r"Accounts/([A-Za-z0-9]+)/Messages", content)
+        match_account = _TWILIO_ACCOUNT_RE.search(content)
         if match_account:
             result["account_sid"] = match_account.group(1)
 
-        match_to = re.search(r"--data-urlencode 'To=([^']+)'", content)
-        if match_to:
-            value = match_to.group(1)
-            result["to"] = value if value.startswith("whatsapp:") else f"whatsapp:{value}"
-
-        match_from = re.search(r"--data-urlencode 'From=([^']+)'", content)
-        if match_from:
-            value = match_from.group(1)
-            result["from"] = value if value.startswith("whatsapp:") else f"whatsapp:{value}"
-
-        match_content = re.search(r"--data-urlencode 'ContentSid=([^']+)'", content)
-        if match_content:
-            result["content_sid"] = match_content.group(1)
-
-        match_credentials = re.search(r"-u\s+([A-Za-z0-9]+):([^\\s]+)", content)
+        # One sweep for all --data-urlencode fields; the first occurrence of each wins
+        fields: Dict[str, str] = {}
+        for name, value in _TWILIO_FIELD_RE.findall(content):
+            fields.setdefault(name, value)
+        for name, key in (("To", "to"), ("From", "from")):
+            value = fields.get(name)
+            if value:
+                result[key] = value if value.startswith("whatsapp:") else f"whatsapp:{value}"
+        if fields.get("ContentSid"):
+            result["content_sid"] = fields["ContentSid"]
+
+        match_credentials = _TWILIO_CREDENTIALS_RE.search(content)
         if match_credentials:
             result["account_sid"] = match_credentials.group(1)
             token = match_credentials.group(2)
@@ -3,28 +3,57 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from collections import Counter
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
-from .classifier import HeuristicClassifier
+from .classifier import ClassificationContext, HeuristicClassifier
 from .configuration import load_runtime_config
-from .llm import LLMClient, LLMInvocationError, render_triage_prompt
-from .models import AlertRecord, RuntimeConfig, SeverityLevel
+from .llm import (
+    LLMClient,
+    LLMInvocationError,
+    parse_batch_triage_response,
+    render_batch_triage_prompt,
+    render_triage_prompt,
+)
+from .models import AlertDecision, AlertRecord, RuntimeConfig, SeverityLevel
 from .notifications import NotificationManager
 from .slack_client import SlackClientWrapper, SlackMessage
 from .storage import AlertStore
 
 
+# How often run_forever applies the alert retention period
+_RETENTION_INTERVAL_SECONDS = 3600
+# Borderline alerts of one page confirmed per LLM request
+_TRIAGE_BATCH_SIZE = 10
+
+
 class RealtimeMonitor:
     """Continuously polls Slack channels, classifies alerts, and emits notifications."""
 
-    def __init__(self, config: RuntimeConfig):
+    def __init__(
+        self,
+        config: RuntimeConfig,
+        notify_workers: int = 4,
+        llm_concurrency: int = 4,
+        fetch_concurrency: int = 4,
+    ):
         self.config = config
         self.store = AlertStore(config.database_path)
         self.slack_client = SlackClientWrapper(config.slack.bot_token)
         self.classifier = HeuristicClassifier(self.store, config.realtime)
         self.notifier = NotificationManager(config.slack, config.notifications, slack_client=self.slack_client)
         self.llm_client: Optional[LLMClient] = None
+        # Bounded outbox drained by poster tasks, so classification of the next
+        # messages overlaps with Slack/WhatsApp delivery of the previous alerts
+        self.notify_workers = max(1, notify_workers)
+        self._outbox: Optional[asyncio.Queue[Tuple[AlertRecord, AlertDecision]]] = None
+        self._posters: List[asyncio.Task] = []
+        # Caps concurrent LLM triage requests when a page has several borderline alerts
+        self._llm_semaphore = asyncio.Semaphore(max(1, llm_concurrency))
+        # Caps concurrent conversations.history calls when polling many channels
+        self._fetch_semaphore = asyncio.Semaphore(max(1, fetch_concurrency))
 
         if config.realtime.llm.enabled:
             try:
@@ -32,72 +61,231 @@ class RealtimeMonitor:
             except ValueError as error:
                 raise RuntimeError(f"Realtime LLM configuration invalid: {error}") from error
 
-    async def run_once(self) -> None:
-        """Poll all channels a single time."""
-        for channel_rule in self.config.channels:
-            if channel_rule.muted:
-                continue
+    def _start_posters(self) -> None:
+        if self._posters:
+            return
+        self._outbox = asyncio.Queue(maxsize=100)
+        self._posters = [asyncio.create_task(self._poster()) for _ in range(self.notify_workers)]
 
-            cursor_key = f"cursor:{channel_rule.id}"
-            oldest_ts = self.store.get_state(cursor_key)
+    async def _poster(self) -> None:
+        while True:
+            alert, decision = await self._outbox.get()
+            try:
+                await self._dispatch_notifications(alert, decision)
+            except Exception as error:  # pylint: disable=broad-except
+                print(f"❌ Failed to deliver alert {alert.message_id}: {error}")
+            finally:
+                self._outbox.task_done()
 
-            # On first run (cursor is None), set cursor to "now" to avoid backfilling old messages
-            if oldest_ts is None:
-                import time
-                current_ts = str(time.time())
-                self.store.set_state(cursor_key, current_ts)
-                print(f"⏭️  First run for {channel_rule.label} - skipping historical messages, cursor set to now")
-                continue
+    async def aclose(self) -> None:
+        """Wait for queued notifications to go out, stop the posters and close the store."""
+        if self._posters:
+            await self._outbox.join()
+            for task in self._posters:
+                task.cancel()
+            await asyncio.gather(*self._posters, return_exceptions=True)
+            self._posters = []
+            self._outbox = None
+        self.store.close()
+
+    async def run_once(self) -> int:
+        """Poll all channels a single time and return how many new messages were fetched."""
+        self._start_posters()
+        fetched = 0
+        # Cursor updates are collected and persisted together in one transaction
+        pending_cursors: Dict[str, str] = {}
+        active_channels = [rule for rule in self.config.channels if not rule.muted]
+        # Read every channel cursor in one query instead of one per channel. SQLite
+        # calls run in a worker thread so they never stall the event loop (posters,
+        # LLM requests and the digest task keep running meanwhile).
+        cursors = await asyncio.to_thread(
+            self.store.get_states, [f"cursor:{rule.id}" for rule in active_channels]
+        )
+        # Channels are fetched concurrently; pages are then classified and stored in
+        # channel order so dedup state and cursors evolve exactly as before.
+        polled = [rule for rule in active_channels if cursors.get(f"cursor:{rule.id}") is not None]
+        pages = await asyncio.gather(
+            *(self._fetch_channel(rule, cursors[f"cursor:{rule.id}"]) for rule in polled),
+            return_exceptions=True,
+        )
+        fetched_pages = dict(zip((rule.id for rule in polled), pages))
+        try:
+            for channel_rule in active_channels:
+                cursor_key = f"cursor:{channel_rule.id}"
+
+                # On first run (cursor is None), set cursor to "now" to avoid backfilling old messages
+                if channel_rule.id not in fetched_pages:
+                    pending_cursors[cursor_key] = str(time.time())
+                    print(f"⏭️  First run for {channel_rule.label} - skipping historical messages, cursor set to now")
+                    continue
+
+                messages = fetched_pages[channel_rule.id]
+                if isinstance(messages, BaseException):
+                    raise messages
+
+                if not messages:
+                    continue
+
+                fetched += len(messages)
+                classified = await asyncio.to_thread(self._classify_page, channel_rule, messages)
+
+                # Borderline alerts get LLM second opinions, several per request and the
+                # requests run concurrently. Without an LLM no coroutine is created at all.
+                if self.llm_client is not None:
+                    borderline = [item for item in classified if self._needs_triage(item[1])]
+                    await asyncio.gather(
+                        *(
+                            self._triage_with_llm(channel_rule, borderline[start : start + _TRIAGE_BATCH_SIZE])
+                            for start in range(0, len(borderline), _TRIAGE_BATCH_SIZE)
+                        )
+                    )
+                # Then record the whole page in one transaction
+                batch = [
+                    (self._build_alert(channel_rule, message, decision, context), decision)
+                    for message, decision, context in classified
+                ]
+                stored = await asyncio.to_thread(self.store.record_alerts, [alert for alert, _ in batch])
+                for (alert, decision), is_new in zip(batch, stored):
+                    if is_new and decision.notify:
+                        await self._outbox.put((alert, decision))
+
+                # Update cursor to the most recent message timestamp processed
+                pending_cursors[cursor_key] = messages[-1].ts
+        finally:
+            await asyncio.to_thread(self.store.set_states, pending_cursors)
 
-            messages = await self.slack_client.fetch_recent_messages(
+        # Alerts are already recorded; finish delivering this cycle's notifications
+        await self._outbox.join()
+        return fetched
+
+    async def _fetch_channel(self, channel_rule, oldest_ts: str) -> List[SlackMessage]:
+        async with self._fetch_semaphore:
+            return await self.slack_client.fetch_recent_messages(
                 channel_rule.id,
                 oldest_ts=oldest_ts,
                 limit=200,
             )
 
-            if not messages:
-                continue
-
-            for message in messages:
-                await self._process_message(channel_rule.id, channel_rule.label, channel_rule, message)
-
-            # Update cursor to the most recent message timestamp processed
-            latest_ts = messages[-1].ts
-            self.store.set_state(cursor_key, latest_ts)
+    def _purge_expired(self) -> None:
+        """Drop alerts past the retention period so lookups keep scanning small indexes."""
+        realtime = self.config.realtime
+        if realtime.retention_days <= 0:
+            return
+        # Never purge rows the recurrence window still counts
+        days = max(realtime.retention_days, -(-realtime.duplicate_window_minutes // (24 * 60)))
+        deleted = self.store.purge_old_alerts(days)
+        if deleted:
+            print(f"🧹 Purged {deleted} alerts older than {days} days")
 
     async def run_forever(self) -> None:
-        interval = max(5, self.config.realtime.check_interval_seconds)
+        base_interval = max(5, self.config.realtime.check_interval_seconds)
+        max_interval = base_interval * 8
+        interval = base_interval
+        loop = asyncio.get_running_loop()
+        next_purge = loop.time()
         while True:
+            if loop.time() >= next_purge:
+                next_purge = loop.time() + _RETENTION_INTERVAL_SECONDS
+                try:
+                    await asyncio.to_thread(self._purge_expired)
+                except Exception as error:  # pylint: disable=broad-except
+                    print(f"❌ Retention purge failed: {error}")
+
+            self.slack_client.last_retry_after = 0.0
             try:
-                await self.run_once()
+                fetched = await self.run_once()
             except Exception as error:  # pylint: disable=broad-except
                 print(f"❌ Realtime monitor error: {error}")
+                fetched = 0
+
+            # Back off while channels are quiet; any new message restores the base interval
+            if fetched:
+                interval = base_interval
+            else:
+                interval = min(interval * 1.5, max_interval)
+            # Never poll again sooner than Slack asked us to wait
+            interval = max(interval, self.slack_client.last_retry_after)
             await asyncio.sleep(interval)
 
-    async def _process_message(self, channel_id: str, channel_label: str, channel_rule, message: SlackMessage) -> None:
-        if self.store.has_message(f"{channel_id}:{message.ts}"):
-            return
+    def _classify_page(
+        self, channel_rule, messages: List[SlackMessage]
+    ) -> List[Tuple[SlackMessage, AlertDecision, ClassificationContext]]:
+        """Classify new messages in order; recurrence counts include earlier messages of the page."""
+        classified: List[Tuple[SlackMessage, AlertDecision, ClassificationContext]] = []
+        pending_hashes: Counter[str] = Counter()
+        # One lookup for the whole page instead of a has_message query per message
+        known = self.store.existing_message_ids([f"{channel_rule.id}:{message.ts}" for message in messages])
+        # Hash each new message once; the hashes feed both the count prefetch and classify
+        hashed = [
+            (message, self.classifier.content_hash(channel_rule, message.text))
+            for message in messages
+            if f"{channel_rule.id}:{message.ts}" not in known
+        ]
+        # Nothing is written until the page is recorded, so the stored count of every
+        # hash on the page is fetched up front in one query instead of one per hash
+        stored_counts = self.store.count_recent_occurrences_by_hash(
+            [content_hash for _, content_hash in hashed],
+            window_minutes=self.config.realtime.duplicate_window_minutes,
+        )
+        for message, content_hash in hashed:
+            decision, context = self.classifier.classify(
+                channel_rule, message.text, pending_hashes, stored_counts, content_hash=content_hash
+            )
+            pending_hashes[context.content_hash] += 1
+            classified.append((message, decision, context))
+        return classified
 
-        decision, context = self.classifier.classify(channel_rule, message.text)
+    def _needs_triage(self, decision: AlertDecision) -> bool:
+        """Borderline decisions (exactly at a non-critical threshold) get an LLM second opinion."""
+        threshold = self.config.realtime.severity_threshold
+        return decision.severity == threshold and decision.severity != SeverityLevel.CRITICAL
 
-        # Optional secondary check with cheap LLM when near threshold
-        if (
-            self.llm_client
-            and decision.severity == self.config.realtime.severity_threshold
-            and decision.severity != SeverityLevel.CRITICAL
-        ):
-            prompt = render_triage_prompt(message.text, channel_label, context.recurrence_count)
-            try:
+    async def _triage_with_llm(
+        self,
+        channel_rule,
+        batch: List[Tuple[SlackMessage, AlertDecision, ClassificationContext]],
+    ) -> None:
+        """Ask the cheap LLM to confirm borderline decisions in one request; updates them in place."""
+        if len(batch) == 1:
+            message, _, context = batch[0]
+            prompt = render_triage_prompt(message.text, channel_rule.label, context.recurrence_count)
+        else:
+            prompt = render_batch_triage_prompt(
+                channel_rule.label, [(message.text, context.recurrence_count) for message, _, context in batch]
+            )
+        try:
+            async with self._llm_semaphore:
                 llm_response = await self.llm_client.invoke(prompt)
-                llm_response = llm_response.strip().upper()
-                if llm_response in {"CRITICAL", "IMPORTANT", "NORMAL", "IGNORE"}:
-                    llm_severity = SeverityLevel(llm_response)
-                    if llm_severity != decision.severity:
-                        decision.severity = llm_severity
-                        decision.notify = llm_severity.at_least(self.config.realtime.severity_threshold)
-                        decision.reason += f"; Overridden by LLM ({llm_response})"
-            except LLMInvocationError as error:
+        except LLMInvocationError as error:
+            for _, decision, _ in batch:
                 decision.reason += f"; LLM error: {error}"
+            return
+
+        if len(batch) == 1:
+            verdicts = {1: llm_response.strip().upper()}
+        else:
+            verdicts = parse_batch_triage_response(llm_response)
+        for index, (_, decision, _) in enumerate(batch, start=1):
+            llm_verdict = verdicts.get(index)
+            # Alerts the LLM skipped keep their heuristic decision
+            if llm_verdict not in {"CRITICAL", "IMPORTANT", "NORMAL", "IGNORE"}:
+                continue
+            llm_severity = SeverityLevel(llm_verdict)
+            if llm_severity != decision.severity:
+                decision.severity = llm_severity
+                decision.notify = llm_severity.at_least(self.config.realtime.severity_threshold)
+                decision.reason += f"; Overridden by LLM ({llm_verdict})"
+
+    def _build_alert(
+        self,
+        channel_rule,
+        message: SlackMessage,
+        decision: AlertDecision,
+        context: ClassificationContext,
+    ) -> AlertRecord:
+        """Turn a classified message into an alert record; the caller persists and notifies."""
+        channel_id = channel_rule.id
+        channel_label = channel_rule.label
 
         message_id = f"{channel_id}:{message.ts}"
         detected_at = datetime.now(timezone.utc)
@@ -118,8 +306,7 @@ class RealtimeMonitor:
             sent_to_slack=decision.notify,
         )
 
-        if self.store.record_alert(alert_record) and decision.notify:
-            await self._dispatch_notifications(alert_record, decision)
+        return alert_record
 
     async def _dispatch_notifications(self, alert: AlertRecord, decision) -> None:
         user_display = alert.user or "unknown"
@@ -143,14 +330,22 @@ class RealtimeMonitor:
             )
 
 
-async def run_realtime_monitor(config_path: str = "config.yaml", once: bool = False) -> None:
-    config = load_runtime_config(config_path)
+async def run_realtime_monitor(
+    config_path: str = "config.yaml",
+    once: bool = False,
+    config: Optional[RuntimeConfig] = None,
+) -> None:
+    """Run the realtime monitor; ``config`` skips reloading an already parsed file."""
+    config = config or load_runtime_config(config_path)
     if not config.realtime.enabled:
         print("Realtime monitor disabled in configuration.")
         return
 
     monitor = RealtimeMonitor(config)
-    if once:
-        await monitor.run_once()
-    else:
-        await monitor.run_forever()
+    try:
+        if once:
+            await monitor.run_once()
+        else:
+            await monitor.run_forever()
+    finally:
+        await monitor.aclose()
@@ -33,6 +33,8 @@ class SlackClientWrapper:
         self.client = WebClient(token=token)
         self._user_cache: Dict[str, str] = {}
         self.rate_limit_sleep = rate_limit_sleep
+        # Longest Retry-After seen since the caller last reset it (0 = not rate limited)
+        self.last_retry_after: float = 0.0
 
     async def fetch_recent_messages(
         self,
@@ -113,6 +115,7 @@ class SlackClientWrapper:
                 except SlackApiError as error:
                     if error.response is not None and error.response.status_code == 429:
                         retry_after = int(error.response.headers.get("Retry-After", self.rate_limit_sleep))
+                        self.last_retry_after = max(self.last_retry_after, retry_after)
                         await asyncio.sleep(retry_after)
                         continue
                     raise
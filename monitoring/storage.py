@@ -2,26 +2,147 @@
 
 from __future__ import annotations
 
+import hashlib
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Optional
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
 
 from .models import AlertRecord, SeverityLevel
 
 
+_UPSERT_STATE_SQL = """
+    INSERT INTO monitor_state (key, value, updated_at)
+    VALUES (?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = CURRENT_TIMESTAMP
+"""
+
+# Duplicates (same message_id) are skipped; rowcount tells the caller which rows were new
+_INSERT_ALERT_SQL = """
+    INSERT OR IGNORE INTO alerts (
+        message_id,
+        channel,
+        channel_label,
+        user,
+        text,
+        slack_ts,
+        importance,
+        importance_code,
+        reason,
+        content_hash,
+        pattern_signature,
+        detected_at,
+        event_ts,
+        sent_to_slack
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Bump whenever the DDL in AlertStore._init_database changes
+_SCHEMA_VERSION = 7
+
+# Bytes of the database file SQLite may memory-map (0 disables mmap I/O)
+_MMAP_SIZE = 256 * 1024 * 1024
+
+# Message IDs remembered in-process so has_message can skip the database
+_KNOWN_MESSAGES_MAX = 10_000
+
+# Free pages returned to the OS after each purge
+_VACUUM_PAGES = 1000
+
+# Severity stored as a small integer (lowest -> highest) for cheap comparisons
+_SEVERITY_CODES = {level: index for index, level in enumerate(SeverityLevel.ordered())}
+# Stored importance text -> enum member; a dict hit is much cheaper than SeverityLevel(value)
+_SEVERITY_BY_VALUE = {level.value: level for level in SeverityLevel}
+
+
+def _epoch_cutoff(**delta: int) -> int:
+    """Return the Unix timestamp (seconds) for now minus the given timedelta."""
+    # Plain epoch arithmetic; no timezone-aware datetime needed for a UTC epoch
+    return int(time.time() - timedelta(**delta).total_seconds())
+
+
+def _text_cutoff(**delta: int) -> str:
+    """Return now minus the given timedelta in SQLite's CURRENT_TIMESTAMP format (UTC)."""
+    return (datetime.now(timezone.utc) - timedelta(**delta)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _alert_row(alert: AlertRecord) -> Tuple:
+    """Return the parameters for _INSERT_ALERT_SQL."""
+    return (
+        alert.message_id,
+        alert.channel_id,
+        alert.channel_label,
+        alert.user,
+        alert.text,
+        alert.slack_ts,
+        alert.importance.value,
+        _SEVERITY_CODES[alert.importance],
+        alert.decision_reason,
+        alert.content_hash,
+        alert.pattern_signature,
+        int(alert.detected_at.timestamp()),
+        alert.event_ts.isoformat() if alert.event_ts else None,
+        1 if alert.sent_to_slack else 0,
+    )
+
+
+class _MessageIdFilter:
+    """Bloom filter over stored message IDs: a miss proves the ID is not stored."""
+
+    _HASHES = 4
+
+    def __init__(self, capacity: int):
+        # ~16 bits per expected entry keeps false positives well under 1% with 4 hashes
+        self._size = max(1 << 20, capacity * 16)
+        self._bits = bytearray(self._size // 8 + 1)
+        # Entries the bit array was sized for, and how many were added so far
+        self.capacity = self._size // 16
+        self.count = 0
+
+    def _positions(self, key: str) -> List[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=4 * self._HASHES).digest()
+        return [int.from_bytes(digest[i : i + 4], "little") % self._size for i in range(0, len(digest), 4)]
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    @property
+    def full(self) -> bool:
+        """True once more entries were added than sized for (false positives climb)."""
+        return self.count > self.capacity
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
 class AlertStore:
     """Repository for alert records, recurrence tracking, and monitor state."""
 
     def __init__(self, db_path: str):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        # LRU of message IDs known to be stored (rows only disappear via purge_old_alerts)
+        self._known_messages: "OrderedDict[str, None]" = OrderedDict()
+        # Built on first existing_message_ids() call; only the realtime path needs it
+        self._id_filter: Optional[_MessageIdFilter] = None
         self._init_database()
 
     def _init_database(self) -> None:
         with self._connection() as conn:
             cursor = conn.cursor()
+            if self._read_schema_version(cursor) == _SCHEMA_VERSION:
+                return
+
+            # Run all DDL and migrations as one transaction (single commit)
+            cursor.execute("BEGIN")
             cursor.execute(
                 """
                 CREATE TABLE IF NOT EXISTS alerts (
@@ -33,10 +154,11 @@ class AlertStore:
                     text TEXT NOT NULL,
                     slack_ts TEXT NOT NULL,
                     importance TEXT NOT NULL,
+                    importance_code INTEGER,
                     reason TEXT,
                     content_hash TEXT,
                     pattern_signature TEXT,
-                    detected_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    detected_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
                     event_ts DATETIME,
                     sent_to_slack BOOLEAN DEFAULT FALSE
                 )
@@ -45,9 +167,55 @@ class AlertStore:
             self._ensure_column(cursor, "alerts", "channel_label", "TEXT", update_sql="UPDATE alerts SET channel_label = channel WHERE channel_label IS NULL OR channel_label = ''")
             self._ensure_column(cursor, "alerts", "detected_at", "DATETIME DEFAULT CURRENT_TIMESTAMP", update_sql="UPDATE alerts SET detected_at = COALESCE(detected_at, created_at, CURRENT_TIMESTAMP)")
             self._ensure_column(cursor, "alerts", "event_ts", "DATETIME")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_channel ON alerts(channel)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_detected_at ON alerts(detected_at)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_content_hash ON alerts(content_hash)")
+            self._ensure_column(
+                cursor,
+                "alerts",
+                "importance_code",
+                "INTEGER",
+                update_sql="""
+                    UPDATE alerts SET importance_code = CASE importance
+                        WHEN 'IGNORE' THEN 0
+                        WHEN 'NORMAL' THEN 1
+                        WHEN 'IMPORTANT' THEN 2
+                        WHEN 'CRITICAL' THEN 3
+                    END
+                    WHERE importance_code IS NULL
+                """,
+            )
+            # Legacy rows stored detected_at as ISO text; convert them to Unix seconds
+            cursor.execute(
+                """
+                UPDATE alerts SET detected_at = CAST(strftime('%s', detected_at) AS INTEGER)
+                WHERE typeof(detected_at) = 'text' AND strftime('%s', detected_at) IS NOT NULL
+                """
+            )
+            # Whatever is still not an integer cannot be placed in time: as TEXT it would sort
+            # above every cutoff (always "recent", never purged), so drop those rows
+            cursor.execute("DELETE FROM alerts WHERE typeof(detected_at) != 'integer'")
+            # Covers the recurrence count (hash + time window) without touching table rows
+            cursor.execute("DROP INDEX IF EXISTS idx_alerts_content_hash")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_alerts_hash_time ON alerts(content_hash, detected_at)"
+            )
+            # Covers every windowed aggregate (statistics, digest tallies, top channels) so
+            # they are index-only range scans; it also serves the time-ordered reads and
+            # purges. It replaces the plain detected_at index, the per-aggregate partial
+            # ones, and the channel index (no query filters on channel alone; it only lured
+            # the top-channels GROUP BY into a full scan)
+            for legacy_index in (
+                "idx_alerts_channel",
+                "idx_alerts_detected_at",
+                "idx_alerts_sent_time",
+                "idx_alerts_critical_time",
+                "idx_alerts_important_time",
+            ):
+                cursor.execute(f"DROP INDEX IF EXISTS {legacy_index}")
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_alerts_time_stats
+                ON alerts(detected_at, importance_code, sent_to_slack, channel)
+                """
+            )
 
             cursor.execute(
                 """
@@ -61,6 +229,7 @@ class AlertStore:
                 """
             )
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_decision_log_message ON decision_log(message_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_decision_log_created ON decision_log(created_at)")
 
             cursor.execute(
                 """
@@ -71,70 +240,113 @@ class AlertStore:
                 )
                 """
             )
+            cursor.execute(_UPSERT_STATE_SQL, ("schema_version", str(_SCHEMA_VERSION)))
             conn.commit()
 
+    @staticmethod
+    def _read_schema_version(cursor: sqlite3.Cursor) -> Optional[int]:
+        try:
+            cursor.execute("SELECT value FROM monitor_state WHERE key = 'schema_version' LIMIT 1")
+        except sqlite3.OperationalError:
+            # monitor_state does not exist yet (fresh database)
+            return None
+        row = cursor.fetchone()
+        try:
+            return int(row[0]) if row else None
+        except ValueError:
+            return None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return the store's long-lived connection, opening it on first use."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            # Lets purges hand freed pages back to the OS. Must precede the WAL switch,
+            # and only applies to new files (existing ones keep their mode until VACUUM)
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            # WAL lets readers run alongside the writer; NORMAL skips the per-commit fsync
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            # Serve reads straight from the OS page cache instead of copying pages
+            conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+            self._conn = conn
+        return self._conn
+
     @contextmanager
     def _connection(self) -> Iterator[sqlite3.Connection]:
-        conn = sqlite3.connect(self.db_path)
-        try:
-            yield conn
-        finally:
-            conn.close()
+        with self._lock:
+            conn = self._get_connection()
+            try:
+                yield conn
+            finally:
+                # Discard uncommitted work, as closing a per-call connection used to
+                if conn.in_transaction:
+                    conn.rollback()
+
+    def close(self) -> None:
+        """Close the underlying connection (reopened lazily if the store is used again)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     def record_alert(self, alert: AlertRecord) -> bool:
         """Insert alert and return True if stored (False if duplicate)."""
+        return self.record_alerts([alert])[0]
+
+    def record_alerts(self, alerts: Sequence[AlertRecord]) -> List[bool]:
+        """Insert several alerts in one transaction; return which ones were new (not duplicates)."""
+        if not alerts:
+            return []
+        stored: List[bool] = []
         with self._connection() as conn:
             cursor = conn.cursor()
-            try:
-                cursor.execute(
-                    """
-                    INSERT INTO alerts (
-                        message_id,
-                        channel,
-                        channel_label,
-                        user,
-                        text,
-                        slack_ts,
-                        importance,
-                        reason,
-                        content_hash,
-                        pattern_signature,
-                        detected_at,
-                        event_ts,
-                        sent_to_slack
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        alert.message_id,
-                        alert.channel_id,
-                        alert.channel_label,
-                        alert.user,
-                        alert.text,
-                        alert.slack_ts,
-                        alert.importance.value,
-                        alert.decision_reason,
-                        alert.content_hash,
-                        alert.pattern_signature,
-                        alert.detected_at.isoformat(),
-                        alert.event_ts.isoformat() if alert.event_ts else None,
-                        1 if alert.sent_to_slack else 0,
-                    ),
-                )
-                cursor.execute(
-                    """
-                    INSERT INTO decision_log (message_id, decision, reason)
-                    VALUES (?, ?, ?)
-                    """,
-                    (
-                        alert.message_id,
-                        alert.importance.value,
-                        alert.decision_reason,
-                    ),
-                )
-                conn.commit()
-                return True
-            except sqlite3.IntegrityError:
-                return False
+            # One commit for the whole batch instead of one per alert
+            cursor.execute("BEGIN IMMEDIATE")
+            # Work out the new rows up front (the write lock is held, so this cannot go
+            # stale), then insert them with executemany instead of one execute per row
+            seen = self._select_existing_ids(cursor, [alert.message_id for alert in alerts])
+            new_alerts: List[AlertRecord] = []
+            for alert in alerts:
+                is_new = alert.message_id not in seen
+                stored.append(is_new)
+                if is_new:
+                    seen.add(alert.message_id)
+                    new_alerts.append(alert)
+            cursor.executemany(_INSERT_ALERT_SQL, [_alert_row(alert) for alert in new_alerts])
+            cursor.executemany(
+                "INSERT INTO decision_log (message_id, decision, reason) VALUES (?, ?, ?)",
+                [(alert.message_id, alert.importance.value, alert.decision_reason) for alert in new_alerts],
+            )
+            conn.commit()
+            if self._id_filter is not None:
+                for alert in new_alerts:
+                    self._id_filter.add(alert.message_id)
+                if self._id_filter.full:
+                    # Rebuilt lazily, sized for the larger table
+                    self._id_filter = None
+        for alert in alerts:
+            self._remember_message(alert.message_id)
+        return stored
+
+    def _get_id_filter(self, conn: sqlite3.Connection) -> _MessageIdFilter:
+        if self._id_filter is None:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM alerts")
+            id_filter = _MessageIdFilter(capacity=cursor.fetchone()[0] * 2)
+            cursor.execute("SELECT message_id FROM alerts")
+            while rows := cursor.fetchmany(1000):
+                for (message_id,) in rows:
+                    id_filter.add(message_id)
+            self._id_filter = id_filter
+        return self._id_filter
+
+    def _remember_message(self, message_id: str) -> None:
+        with self._lock:
+            self._known_messages[message_id] = None
+            self._known_messages.move_to_end(message_id)
+            if len(self._known_messages) > _KNOWN_MESSAGES_MAX:
+                self._known_messages.popitem(last=False)
 
     def mark_sent(self, message_id: str) -> None:
         with self._connection() as conn:
@@ -147,9 +359,41 @@ class AlertStore:
 
     def has_message(self, message_id: str) -> bool:
         with self._connection() as conn:
+            if message_id in self._known_messages:
+                self._known_messages.move_to_end(message_id)
+                return True
             cursor = conn.cursor()
             cursor.execute("SELECT 1 FROM alerts WHERE message_id = ? LIMIT 1", (message_id,))
-            return cursor.fetchone() is not None
+            found = cursor.fetchone() is not None
+            if found:
+                self._remember_message(message_id)
+            return found
+
+    def existing_message_ids(self, message_ids: Sequence[str]) -> Set[str]:
+        """Return which of ``message_ids`` are already stored, using one query for the unknown ones."""
+        with self._connection() as conn:
+            found = {message_id for message_id in message_ids if message_id in self._known_messages}
+            # Novel IDs (the common case) are ruled out by the Bloom filter without a query;
+            # only possible hits are confirmed against the table
+            id_filter = self._get_id_filter(conn)
+            candidates = [
+                message_id for message_id in message_ids if message_id not in found and message_id in id_filter
+            ]
+            for message_id in self._select_existing_ids(conn.cursor(), candidates):
+                found.add(message_id)
+                self._remember_message(message_id)
+            return found
+
+    @staticmethod
+    def _select_existing_ids(cursor: sqlite3.Cursor, message_ids: Sequence[str]) -> Set[str]:
+        found: Set[str] = set()
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(message_ids), 500):
+            chunk = message_ids[start : start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor.execute(f"SELECT message_id FROM alerts WHERE message_id IN ({placeholders})", chunk)
+            found.update(message_id for (message_id,) in cursor.fetchall())
+        return found
 
     def count_recent_occurrences(self, content_hash: str, window_minutes: int) -> int:
         with self._connection() as conn:
@@ -158,21 +402,99 @@ class AlertStore:
                 """
                 SELECT COUNT(*) FROM alerts
                 WHERE content_hash = ?
-                  AND detected_at >= datetime('now', ?)
+                  AND detected_at >= ?
                 """,
-                (content_hash, f"-{window_minutes} minutes"),
+                (content_hash, _epoch_cutoff(minutes=window_minutes)),
             )
             row = cursor.fetchone()
             return int(row[0]) if row and row[0] is not None else 0
 
+    def count_recent_occurrences_by_hash(
+        self, content_hashes: Sequence[str], window_minutes: int
+    ) -> Dict[str, int]:
+        """Return the recent occurrence count of every hash (0 included), using one query per 500."""
+        counts = dict.fromkeys(content_hashes, 0)
+        hashes = list(counts)
+        cutoff = _epoch_cutoff(minutes=window_minutes)
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start : start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(
+                    f"""
+                    SELECT content_hash, COUNT(*) FROM alerts
+                    WHERE content_hash IN ({placeholders})
+                      AND detected_at >= ?
+                    GROUP BY content_hash
+                    """,
+                    (*chunk, cutoff),
+                )
+                counts.update(cursor.fetchall())
+        return counts
+
     def fetch_recent_alerts(
         self,
         lookback_minutes: int,
         include_filtered: bool = True,
         min_severity: SeverityLevel = SeverityLevel.IGNORE,
     ) -> List[AlertRecord]:
+        """Return recent alerts as a list (newest first)."""
+        return list(self.iter_recent_alerts(lookback_minutes, include_filtered, min_severity))
+
+    def iter_recent_alerts(
+        self,
+        since_minutes: int,
+        include_filtered: bool = True,
+        min_severity: SeverityLevel = SeverityLevel.IGNORE,
+    ) -> Iterator[AlertRecord]:
+        """Yield recent alerts (newest first) without materializing the result set."""
+        return self._stream_recent_alerts(since_minutes, include_filtered, min_severity)
+
+    def count_recent_alerts(
+        self,
+        lookback_minutes: int,
+        include_filtered: bool = True,
+        min_severity: SeverityLevel = SeverityLevel.IGNORE,
+    ) -> Dict[str, int]:
+        """Tally the alerts ``iter_recent_alerts`` would yield without reading them back."""
+        sent_clause = "" if include_filtered else " AND sent_to_slack = 1"
         with self._connection() as conn:
             cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT
+                    COUNT(*) AS total,
+                    SUM(sent_to_slack = 1) AS sent,
+                    SUM(importance_code = 3) AS critical,
+                    SUM(importance_code = 2) AS important
+                FROM alerts
+                WHERE detected_at >= ?
+                  AND importance_code >= ?{sent_clause}
+                """,
+                (_epoch_cutoff(minutes=lookback_minutes), _SEVERITY_CODES[min_severity]),
+            )
+            total, sent, critical, important = cursor.fetchone()
+        return {
+            "total": total or 0,
+            "sent": sent or 0,
+            "critical": critical or 0,
+            "important": important or 0,
+        }
+
+    def _stream_recent_alerts(
+        self,
+        lookback_minutes: int,
+        include_filtered: bool,
+        min_severity: SeverityLevel,
+    ) -> Iterator[AlertRecord]:
+        # Lazily consumed, so read through a private read-only connection: the shared one
+        # would need the lock held across yields, and WAL gives this reader a stable
+        # snapshot while other threads keep writing
+        reader = sqlite3.connect(f"{Path(self.db_path).resolve().as_uri()}?mode=ro", uri=True)
+        cursor = reader.cursor()
+        try:
+            cursor.arraysize = 256
             cursor.execute(
                 """
                 SELECT
@@ -190,48 +512,37 @@ class AlertStore:
                     pattern_signature,
                     event_ts
                 FROM alerts
-                WHERE detected_at >= datetime('now', ?)
+                WHERE detected_at >= ?
+                  AND typeof(detected_at) = 'integer'
+                  AND importance_code >= ?
                 ORDER BY detected_at DESC
                 """,
-                (f"-{lookback_minutes} minutes",),
-            )
-            rows = cursor.fetchall()
-
-        severity_min_index = {level: index for index, level in enumerate(SeverityLevel.ordered())}[
-            min_severity
-        ]
-
-        alerts: List[AlertRecord] = []
-        for row in rows:
-            severity = SeverityLevel(row[6])
-            sent_to_slack = bool(row[9])
-            if not include_filtered and not sent_to_slack:
-                continue
-            if severity_min_index > {level: index for index, level in enumerate(SeverityLevel.ordered())}[severity]:
-                continue
-            detected_at = datetime.fromisoformat(row[8])
-            event_ts = datetime.fromisoformat(row[12]) if row[12] else None
-            alerts.append(
-                AlertRecord(
-                    message_id=row[0],
-                    channel_id=row[1],
-                    channel_label=row[2] or row[1],
-                    user=row[3],
-                    text=row[4],
-                    slack_ts=row[5],
-                    importance=severity,
-                    decision_reason=row[7] or "",
-                    detected_at=detected_at,
-                    sent_to_slack=sent_to_slack,
-                    content_hash=row[10],
-                    pattern_signature=row[11],
-                    event_ts=event_ts,
-                )
+                (_epoch_cutoff(minutes=lookback_minutes), _SEVERITY_CODES[min_severity]),
             )
-        return alerts
-
-    def iter_recent_alerts(self, since_minutes: int) -> Iterable[AlertRecord]:
-        return self.fetch_recent_alerts(lookback_minutes=since_minutes, include_filtered=True)
+            while rows := cursor.fetchmany():
+                for row in rows:
+                    sent_to_slack = bool(row[9])
+                    # Skip filtered rows before parsing any of their columns
+                    if not include_filtered and not sent_to_slack:
+                        continue
+                    severity = _SEVERITY_BY_VALUE.get(row[6]) or SeverityLevel(row[6])
+                    yield AlertRecord(
+                        message_id=row[0],
+                        channel_id=row[1],
+                        channel_label=row[2] or row[1],
+                        user=row[3],
+                        text=row[4],
+                        slack_ts=row[5],
+                        importance=severity,
+                        decision_reason=row[7] or "",
+                        detected_at=datetime.fromtimestamp(row[8], tz=timezone.utc),
+                        sent_to_slack=sent_to_slack,
+                        content_hash=row[10],
+                        pattern_signature=row[11],
+                        event_ts=datetime.fromisoformat(row[12]) if row[12] else None,
+                    )
+        finally:
+            reader.close()
 
     def get_state(self, key: str) -> Optional[str]:
         with self._connection() as conn:
@@ -240,32 +551,57 @@ class AlertStore:
             row = cursor.fetchone()
             return row[0] if row else None
 
+    def get_states(self, keys: Sequence[str]) -> Dict[str, str]:
+        """Return the stored values for several keys in one query (missing keys are omitted)."""
+        if not keys:
+            return {}
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            placeholders = ", ".join("?" * len(keys))
+            cursor.execute(f"SELECT key, value FROM monitor_state WHERE key IN ({placeholders})", tuple(keys))
+            return dict(cursor.fetchall())
+
     def set_state(self, key: str, value: str) -> None:
         with self._connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO monitor_state (key, value, updated_at)
-                VALUES (?, ?, CURRENT_TIMESTAMP)
-                ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = CURRENT_TIMESTAMP
-                """,
-                (key, value),
-            )
+            cursor.execute(_UPSERT_STATE_SQL, (key, value))
+            conn.commit()
+
+    def set_states(self, pairs: Mapping[str, str]) -> None:
+        """Upsert several state entries in a single transaction (one commit)."""
+        rows = [(key, value) for key, value in pairs.items()]
+        if not rows:
+            return
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.executemany(_UPSERT_STATE_SQL, rows)
             conn.commit()
 
     def purge_old_alerts(self, older_than_days: int = 30) -> int:
         with self._connection() as conn:
             cursor = conn.cursor()
+            # Both deletes share one write transaction (a single commit)
+            cursor.execute("BEGIN IMMEDIATE")
             cursor.execute(
-                "DELETE FROM alerts WHERE detected_at < datetime('now', ?)",
-                (f"-{older_than_days} days",),
+                "DELETE FROM alerts WHERE detected_at < ?",
+                (_epoch_cutoff(days=older_than_days),),
             )
             deleted = cursor.rowcount or 0
+            # created_at is CURRENT_TIMESTAMP text (UTC); a literal bound cutoff can use its index
             cursor.execute(
-                "DELETE FROM decision_log WHERE created_at < datetime('now', ?)",
-                (f"-{older_than_days} days",),
+                "DELETE FROM decision_log WHERE created_at < ?",
+                (_text_cutoff(days=older_than_days),),
             )
+            if deleted:
+                self._known_messages.clear()
+                # Purged IDs would linger as false positives; rebuild on next use
+                self._id_filter = None
             conn.commit()
+            if deleted:
+                # Release a bounded number of freed pages (no-op unless auto_vacuum=INCREMENTAL).
+                # executescript steps the pragma to completion; execute() frees only one page
+                conn.executescript(f"PRAGMA incremental_vacuum({_VACUUM_PAGES});")
             return deleted
 
     @staticmethod
@@ -290,17 +626,19 @@ class AlertStore:
     def get_statistics(self, hours: int = 24) -> Dict[str, int]:
         with self._connection() as conn:
             cursor = conn.cursor()
+            cutoff = _epoch_cutoff(hours=hours)
+            # The total has to walk the whole window anyway, so count everything in that one pass
             cursor.execute(
                 """
                 SELECT
                     COUNT(*) AS total,
-                    SUM(CASE WHEN sent_to_slack = 1 THEN 1 ELSE 0 END) AS sent,
-                    SUM(CASE WHEN importance = 'CRITICAL' THEN 1 ELSE 0 END) AS critical,
-                    SUM(CASE WHEN importance = 'IMPORTANT' THEN 1 ELSE 0 END) AS important
+                    SUM(sent_to_slack = 1) AS sent,
+                    SUM(importance_code = 3) AS critical,
+                    SUM(importance_code = 2) AS important
                 FROM alerts
-                WHERE detected_at >= datetime('now', ?)
+                WHERE detected_at >= ?
                 """,
-                (f"-{hours} hours",),
+                (cutoff,),
             )
             total, sent, critical, important = cursor.fetchone()
 
@@ -308,12 +646,12 @@ class AlertStore:
                 """
                 SELECT channel, COUNT(*)
                 FROM alerts
-                WHERE detected_at >= datetime('now', ?)
+                WHERE detected_at >= ?
                 GROUP BY channel
                 ORDER BY COUNT(*) DESC
                 LIMIT 5
                 """,
-                (f"-{hours} hours",),
+                (cutoff,),
             )
             top_channels = cursor.fetchall()
 
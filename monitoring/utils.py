@@ -4,22 +4,96 @@ from __future__ import annotations
 
 import hashlib
 import re
-from typing import Iterable
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
 
 
 WHITESPACE_RE = re.compile(r"\s+")
 
+# Pristine hash state; copying it is cheaper than constructing a new blake2b each time
+_HASH_SEED = hashlib.blake2b(digest_size=16)
+
 
 def normalize_text(text: str) -> str:
     """Normalize text by collapsing whitespace."""
     return WHITESPACE_RE.sub(" ", text.strip())
 
 
-def compute_content_hash(text: str, extra_keys: Iterable[str] | None = None) -> str:
-    """Return a deterministic hash for deduplication."""
-    normalized = normalize_text(text).lower()
-    digest = hashlib.md5(normalized.encode("utf-8"))
+def compute_content_hash(
+    text: str,
+    extra_keys: Iterable[str] | None = None,
+    *,
+    normalized: bool = False,
+) -> str:
+    """Return a deterministic hash for deduplication (32 hex chars).
+
+    Pass ``normalized=True`` when ``text`` already went through
+    ``normalize_text(...).lower()`` to skip repeating that pass.
+    """
+    if not normalized:
+        text = normalize_text(text).lower()
+    # Not a security boundary; BLAKE2b is faster than MD5 and 16 bytes keeps the width
+    digest = _HASH_SEED.copy()
+    digest.update(text.encode("utf-8"))
     if extra_keys:
         for key in extra_keys:
             digest.update(f"::{key}".encode("utf-8"))
     return digest.hexdigest()
+
+
+@lru_cache(maxsize=256)
+def compile_keyword_matcher(keywords: Tuple[str, ...]) -> Optional[re.Pattern[str]]:
+    """Compile keywords into one case-insensitive alternation (substring semantics).
+
+    Scanning a message is then a single regex pass instead of one substring
+    search per keyword. Returns None when there is nothing to match.
+    """
+    escaped = [re.escape(keyword) for keyword in keywords if keyword]
+    if not escaped:
+        return None
+    # Longest first so overlapping keywords report the most specific match
+    escaped.sort(key=len, reverse=True)
+    return re.compile("|".join(escaped), re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def compile_keyword_automaton(keywords: Tuple[str, ...]):
+    """Build an Aho-Corasick automaton over the lowercased keywords (None if empty).
+
+    Matching cost depends only on the text length, not on how many keywords a
+    channel configures. Requires the optional ``pyahocorasick`` package.
+    """
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        lowered = keyword.lower()
+        # First spelling wins, as with the regex matcher
+        if lowered and lowered not in automaton:
+            automaton.add_word(lowered, keyword)
+    if not len(automaton):
+        return None
+    automaton.make_automaton()
+    return automaton
+
+
+def find_keyword(keywords: Iterable[str], text: str) -> Optional[str]:
+    """Return the configured keyword found in ``text`` (case-insensitive), if any."""
+    keywords = tuple(keywords)
+    if ahocorasick is not None:
+        automaton = compile_keyword_automaton(keywords)
+        if automaton is None:
+            return None
+        # Leftmost-longest, matching the regex alternation's preference
+        return next((keyword for _, keyword in automaton.iter_long(text.lower())), None)
+    matcher = compile_keyword_matcher(keywords)
+    if matcher is None:
+        return None
+    match = matcher.search(text)
+    if match is None:
+        return None
+    found = match.group(0).lower()
+    return next((keyword for keyword in keywords if keyword.lower() == found), match.group(0))
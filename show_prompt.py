@@ -10,8 +10,13 @@ from slack_monitor import SlackMonitor
 import yaml
 
 # Load config
-with open("config.yaml") as f:
-    config = yaml.safe_load(f)
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+with open("config.yaml", "rb") as f:
+    config = yaml.load(f, Loader=YamlLoader)
 
 # Create monitor
 monitor = SlackMonitor(
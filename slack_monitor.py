@@ -4,18 +4,188 @@ Slack Alert Monitor using Claude Agent SDK
 Monitors Slack channels and filters messages that deserve attention
 """
 
+from __future__ import annotations
+
 import asyncio
+import json
 import os
+import re
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Set, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, List, Tuple
 from dataclasses import dataclass
 from pathlib import Path
-from claude_agent_sdk import (
-    ClaudeSDKClient,
-    ClaudeAgentOptions,
-    AssistantMessage,
-    ToolResultBlock
+
+# The SDK is imported on first use (options/connect) to keep startup cheap
+if TYPE_CHECKING:
+    from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# Slack conversation IDs (public/private channels and DMs)
+_CHANNEL_ID_RE = re.compile(r"^[CGD][A-Z0-9]{8,}$")
+# "name=ID" lines returned by the channel resolution query
+_CHANNEL_MAPPING_RE = re.compile(r"^\s*#?([\w.-]+)\s*=\s*([CGD][A-Z0-9]{8,})\s*$", re.MULTILINE)
+# "timestamp | user | text" lines returned by the history fetch query
+_HISTORY_LINE_RE = re.compile(r"^\s*(\d{9,}\.\d+)\s*\|\s*([^|]*?)\s*\|\s*(.*?)\s*$", re.MULTILINE)
+# Cheap structural signals that a message may deserve the LLM's attention
+_MENTION_RE = re.compile(r"<?@[UW][A-Z0-9]+>?")
+_ERROR_RE = re.compile(
+    r"\b(?:error|erro|exception|fail(?:ed|ure)?|falha|timeout|down|offline|indispon[ií]vel|"
+    r"incident(?:e)?|cr[ií]tic(?:al|o|a))\b",
+    re.IGNORECASE,
+)
+# Both signals in one alternation, so screening a message is a single scan
+_PREFILTER_RE = re.compile(rf"{_MENTION_RE.pattern}|(?i:{_ERROR_RE.pattern})")
+# Slack rate-limit errors surface as "ratelimited" or an HTTP 429 in the message
+_RATE_LIMIT_RE = re.compile(r"ratelimited|429", re.IGNORECASE)
+# First status word in Claude's reply to a posting request decides the outcome
+_RESPONSE_STATUS_RE = re.compile(
+    r"\b(?P<err>error|failed|not found)\b|\b(?P<ok>success|sent|posted)\b",
+    re.IGNORECASE,
+)
+
+# Note: Only include tools we actually need
+_TOOLS_READONLY = (
+    "mcp__slack__channels_list",
+    "mcp__slack__conversations_history",
+    "mcp__slack__conversations_replies",
+    "mcp__slack__conversations_search_messages",
 )
+_TOOLS_WITH_POST = _TOOLS_READONLY + ("mcp__slack__conversations_add_message",)
+
+_STATE_DIR = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "slack-agent"
+# name -> ID mappings persisted between runs (see SlackMonitor._save_channel_cache).
+# Opt-in: IDs are per workspace, so each monitor needs a file of its own
+_CHANNEL_CACHE_FILE = _STATE_DIR / "channel_ids.json"
+# Wall-clock time of the last completed check, so a restart resumes the window.
+# Opt-in like the channel cache, one file per monitor
+_LAST_CHECK_FILE = _STATE_DIR / "last_check.json"
+
+# Hard cap on remembered message IDs, on top of the time-based eviction
+_SEEN_MESSAGES_MAX = 10_000
+
+# Importance levels worth reporting in a free-form (all-channels) analysis
+_ACTIONABLE_RE = re.compile(r"\b(?:CRITICAL|IMPORTANT)\b")
+
+
+_IMPORTANCE_LEVELS = ("CRITICAL", "IMPORTANT", "NORMAL", "IGNORE")
+
+
+# Prompts are module constants so the invariant text stays byte-identical across
+# cycles (prompt-cache friendly); only a short variable suffix is rendered per call.
+_SYSTEM_PROMPT_TEMPLATE = """You are a Slack message analyzer helping filter important messages.
+
+You have access to Slack via MCP tools. USE these tools to fetch real messages from Slack:
+- mcp__slack__channels_list: List all channels
+- mcp__slack__conversations_history: Get message history from channels
+- mcp__slack__conversations_search_messages: Search for messages
+
+Your job is to USE these tools to fetch messages and analyze which ones deserve immediate attention.
+
+Consider a message important if it:
+1. Contains urgent keywords: {keywords}
+2. Asks direct questions to the user
+3. Reports errors, incidents, or system failures
+4. Requests immediate action or approval
+5. Contains mentions or direct messages
+6. Reports critical business metrics or alerts
+
+For each message, classify it as:
+- CRITICAL: Needs immediate attention
+- IMPORTANT: Should be reviewed soon
+- NORMAL: Can be reviewed later
+- IGNORE: Not relevant or spam
+
+⚠️ EMERGENCY ESCALATION:
+If a CRITICAL issue is:
+- CATASTROPHIC (system failure imminent)
+- RAPIDLY WORSENING (degrading quickly)
+- URGENT ACTION REQUIRED (immediate intervention needed)
+- TOP PRIORITY (overrides everything)
+
+Include these exact keywords in your Reason: "CATASTROPHIC", "URGENT ACTION REQUIRED", "IMMEDIATE", "TOP PRIORITY", "RAPID", or "EMERGENCY"
+
+This will trigger an emergency override to ensure the alert is sent immediately!
+
+Be concise and focus on actionable insights."""
+
+_CHANNEL_LOOKUP_QUERY_PREFIX = """USE the mcp__slack__channels_list tool to look up the IDs of the channels listed below.
+
+Reply with one line per channel in the format name=ID and nothing else.
+Omit channels that do not exist.
+
+Channels: """
+
+_HISTORY_QUERY_PREFIX = """USE the mcp__slack__conversations_history tool to fetch recent messages from the channel given below.
+
+Do NOT analyze the messages. Return them verbatim, one per line, as:
+timestamp | user | text
+
+If there are no messages, reply with exactly: NONE
+
+"""
+
+_CLASSIFY_QUERY_PREFIX = """Classify the following Slack messages. They were already fetched; do NOT call any tools.
+
+Classification should be based on message content, context, and channel-specific rules.
+Do NOT rely solely on keywords - understand the actual meaning and urgency.
+
+Respond with ONLY a JSON array (no prose) where each element matches:
+{"channel": str, "user": str, "ts": str, "importance": "CRITICAL" | "IMPORTANT" | "NORMAL" | "IGNORE", "reason": str}
+
+Messages:
+"""
+
+_ALL_CHANNELS_QUERY_PREFIX = """USE the Slack MCP tools to check for recent messages across all channels.
+
+IMPORTANT: You must use the mcp__slack__conversations_history tool to fetch messages.
+
+For each message, analyze based on content and context:
+1. Channel name
+2. User who sent it
+3. Message text
+4. Importance level (CRITICAL, IMPORTANT, NORMAL, IGNORE)
+5. Brief reason
+
+Focus on actual urgency and meaning, not just keywords.
+
+If no messages are found, reply with exactly NONE and nothing else.
+
+"""
+# Sentinel reply for an empty all-channels search (see _ALL_CHANNELS_QUERY_PREFIX)
+_NO_MESSAGES_REPLY = "NONE"
+
+_POST_QUERY_PREFIX = """USE the mcp__slack__conversations_add_message tool RIGHT NOW to send the message below to the channel named below.
+
+IMPORTANT: Do NOT check if the channel exists first. Just send the message directly.
+If you get an error, show me the EXACT error message.
+
+"""
+
+
+def _json_loads(data: str | bytes) -> Any:
+    """Decode JSON with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data: Any) -> str:
+    """Encode JSON with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, ensure_ascii=False)
 
 
 @dataclass
@@ -41,6 +211,12 @@ class SlackMonitor:
         mcp_server_config: Dict[str, Any] = None,
         summary_channel: str = None,
         response_timeout: float = 60.0,
+        channel_cache_ttl: float = 600.0,
+        use_socket_mode: bool = False,
+        fetch_pool_size: int | None = None,
+        summary_flush_interval: float = 5.0,
+        channel_cache_file: str | Path | None = None,
+        last_check_file: str | Path | None = None,
     ):
         """
         Initialize Slack Monitor
@@ -51,14 +227,69 @@ class SlackMonitor:
             check_interval: How often to check for new messages (seconds)
             mcp_server_config: Configuration for the Slack MCP server
             summary_channel: Channel to send analysis summaries to (None = don't send)
+            response_timeout: Maximum seconds to wait for a Claude response
+            channel_cache_ttl: Seconds a resolved channel name -> ID mapping stays valid
+            use_socket_mode: Receive messages via Slack Socket Mode (needs SLACK_APP_TOKEN)
+                instead of polling every check_interval
+            fetch_pool_size: Claude/MCP sessions used for parallel history fetches
+                (None = one per monitored channel, at most 4)
+            summary_flush_interval: Seconds to coalesce queued summary posts into a
+                single Slack message per channel
+            channel_cache_file: JSON file persisting channel name -> ID mappings
+                across runs (None = in-memory only). Channel IDs belong to one
+                workspace, so never share the file between monitors
+                of different workspaces
+            last_check_file: JSON file persisting the last check time so a restart
+                covers the downtime instead of only the last check_interval
+                (None = in-memory only). Must be unique per monitor
         """
         self.channels_to_monitor = channels_to_monitor or []
         self.keywords = keywords or ["urgent", "critical", "emergency", "help", "alert"]
         self.check_interval = check_interval
         self.summary_channel = summary_channel
         self.response_timeout = max(5.0, response_timeout)
-        self.seen_messages: Set[str] = set()
+        self.use_socket_mode = use_socket_mode
+        if fetch_pool_size is None:
+            fetch_pool_size = min(len(self.channels_to_monitor), 4)
+        self.fetch_pool_size = max(0, fetch_pool_size)
+        self.summary_flush_interval = max(0.0, summary_flush_interval)
+        # Adaptive polling: back off on quiet/rate-limited cycles, reset on activity
+        self._min_interval = self.check_interval
+        self._max_interval = max(self.check_interval, 3600)
+        self._current_interval = self.check_interval
+        # "channel:ts" -> monotonic time first seen, oldest first
+        self.seen_messages: "OrderedDict[str, float]" = OrderedDict()
+        # Wall-clock time is for display only; the window uses the monotonic clock,
+        # which NTP/DST adjustments cannot move backwards
         self.last_check_time = datetime.now() - timedelta(seconds=self.check_interval)
+        self._last_check_mono = time.monotonic() - self.check_interval
+        # All-channels fallback: consecutive cycles with nothing actionable, used
+        # to skip the (expensive) search while the workspace stays quiet
+        self._cycles_empty_in_row = 0
+        self._last_cycle_ts = 0.0
+        self._last_cycle_keywords: Tuple[str, ...] = tuple(self.keywords)
+        # channel name -> (channel ID, monotonic time resolved)
+        self._channel_cache: Dict[str, Tuple[str, float]] = {}
+        self._channel_cache_ttl = channel_cache_ttl
+        self._channel_cache_file = Path(channel_cache_file) if channel_cache_file else None
+        self._channel_cache_dir_ready = False
+        self._load_channel_cache()
+        self._last_check_file = Path(last_check_file) if last_check_file else None
+        self._last_check_dir_ready = False
+        self._load_last_check()
+        # Socket Mode: monitored channel ID -> name, and a lock serializing analyses
+        self._monitored_ids: Dict[str, str] = {}
+        self._event_lock = asyncio.Lock()
+        # Multi-pattern keyword matcher: one pass over the text regardless of keyword count
+        self._kw_automaton = None
+        self._keyword_re = None
+        if self.keywords and ahocorasick is not None:
+            self._kw_automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self._kw_automaton.add_word(keyword.lower(), keyword)
+            self._kw_automaton.make_automaton()
+        elif self.keywords:
+            self._keyword_re = re.compile("|".join(map(re.escape, self.keywords)), re.IGNORECASE)
 
         # Configure MCP server for Slack
         if not mcp_server_config:
@@ -92,122 +323,203 @@ class SlackMonitor:
                     }
                 }
 
-        # Set up Claude options with Slack MCP server
-        # Note: Only include tools we actually need
-        allowed_tools = [
-            "mcp__slack__conversations_history",
-            "mcp__slack__conversations_replies",
-            "mcp__slack__conversations_search_messages",
-        ]
-
-        # Add posting tool if summary channel is configured
-        if self.summary_channel:
-            allowed_tools.append("mcp__slack__conversations_add_message")
+        # Set up Claude options with Slack MCP server; posting is only allowed
+        # when a summary channel is configured
+        allowed_tools = _TOOLS_WITH_POST if self.summary_channel else _TOOLS_READONLY
 
-        self.options = ClaudeAgentOptions(
-            mcp_servers={"slack": mcp_server_config},
-            allowed_tools=allowed_tools,
-            system_prompt=self._create_system_prompt(),
-            permission_mode="bypassPermissions"
-        )
+        self._system_prompt = _SYSTEM_PROMPT_TEMPLATE.format(keywords=", ".join(sorted(self.keywords)))
+        self._mcp_server_config = mcp_server_config
+        self._allowed_tools = allowed_tools
+        self._options: ClaudeAgentOptions | None = None
 
         self.client: ClaudeSDKClient | None = None
+        # Extra sessions used to fetch channel histories in parallel
+        self._fetch_clients: List[ClaudeSDKClient] = []
+        self._fetch_pool: asyncio.Queue | None = None
+        self._connected = False
+        # Outbound (channel, text) summary posts, coalesced by _sender_loop
+        self._out_queue: asyncio.Queue | None = None
+        self._sender_task: asyncio.Task | None = None
+
+        # Direct Web API client for summary posts; None falls back to the MCP tool
+        self._web = None
+        server_env = mcp_server_config.get("env") or {}
+        web_token = server_env.get("SLACK_BOT_TOKEN") or server_env.get("SLACK_MCP_XOXP_TOKEN")
+        if self.summary_channel and web_token:
+            try:
+                from slack_sdk.web.async_client import AsyncWebClient
+            except ImportError:  # pragma: no cover - optional dependency
+                AsyncWebClient = None
+            if AsyncWebClient is not None:
+                self._web = AsyncWebClient(token=web_token)
+
+    @property
+    def options(self) -> ClaudeAgentOptions:
+        """Claude options, built (and the SDK imported) on first access."""
+        if self._options is None:
+            from claude_agent_sdk import ClaudeAgentOptions
+
+            self._options = ClaudeAgentOptions(
+                mcp_servers={"slack": self._mcp_server_config},
+                allowed_tools=list(self._allowed_tools),
+                system_prompt=self._create_system_prompt(),
+                permission_mode="bypassPermissions"
+            )
+        return self._options
 
     def _create_system_prompt(self) -> str:
         """Create a system prompt for Claude to analyze Slack messages"""
-        keywords_str = ", ".join(self.keywords)
-        return f"""You are a Slack message analyzer helping filter important messages.
-
-You have access to Slack via MCP tools. USE these tools to fetch real messages from Slack:
-- mcp__slack__channels_list: List all channels
-- mcp__slack__conversations_history: Get message history from channels
-- mcp__slack__conversations_search_messages: Search for messages
+        return self._system_prompt
 
-Your job is to USE these tools to fetch messages and analyze which ones deserve immediate attention.
-
-Consider a message important if it:
-1. Contains urgent keywords: {keywords_str}
-2. Asks direct questions to the user
-3. Reports errors, incidents, or system failures
-4. Requests immediate action or approval
-5. Contains mentions or direct messages
-6. Reports critical business metrics or alerts
-
-For each message, classify it as:
-- CRITICAL: Needs immediate attention
-- IMPORTANT: Should be reviewed soon
-- NORMAL: Can be reviewed later
-- IGNORE: Not relevant or spam
+    async def connect(self):
+        """Connect to Claude with Slack MCP server"""
+        from claude_agent_sdk import ClaudeSDKClient
 
-⚠️ EMERGENCY ESCALATION:
-If a CRITICAL issue is:
-- CATASTROPHIC (system failure imminent)
-- RAPIDLY WORSENING (degrading quickly)
-- URGENT ACTION REQUIRED (immediate intervention needed)
-- TOP PRIORITY (overrides everything)
+        self.client = ClaudeSDKClient(options=self.options)
 
-Include these exact keywords in your Reason: "CATASTROPHIC", "URGENT ACTION REQUIRED", "IMMEDIATE", "TOP PRIORITY", "RAPID", or "EMERGENCY"
+        # One SDK session multiplexes a single conversation, so per-channel
+        # fetches get their own pool of sessions (each with its own MCP worker).
+        # Sessions are checked out of a queue, so each runs one query at a time.
+        self._fetch_clients = [
+            ClaudeSDKClient(options=self.options) for _ in range(self.fetch_pool_size)
+        ]
+        # Spawn the MCP subprocesses concurrently instead of one after another
+        await asyncio.gather(
+            self.client.connect(), *(fetch_client.connect() for fetch_client in self._fetch_clients)
+        )
+        self._fetch_pool = asyncio.Queue()
+        # With no dedicated sessions, fetches take turns on the main session
+        for fetch_client in self._fetch_clients or [self.client]:
+            self._fetch_pool.put_nowait(fetch_client)
+        if self._web is not None:
+            self._out_queue = asyncio.Queue()
+            self._sender_task = asyncio.create_task(self._sender_loop())
+        self._connected = True
+        print("✅ Connected to Claude with Slack MCP server")
 
-This will trigger an emergency override to ensure the alert is sent immediately!
+    async def ensure_connected(self):
+        """Connect if needed; reconnect after a failure cleared the liveness flag."""
+        if self._connected and self.client:
+            return
+        if self.client or self._fetch_clients:
+            try:
+                await self.disconnect()
+            except Exception as error:
+                print(f"⚠️ Failed to close stale Claude session: {error}")
+        await self.connect()
 
-Be concise and focus on actionable insights."""
+    async def __aenter__(self) -> "SlackMonitor":
+        await self.connect()
+        return self
 
-    async def connect(self):
-        """Connect to Claude with Slack MCP server"""
-        self.client = ClaudeSDKClient(options=self.options)
-        await self.client.connect()
-        print("✅ Connected to Claude with Slack MCP server")
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.disconnect()
 
     async def disconnect(self):
         """Disconnect from Claude"""
+        if self._sender_task is not None:
+            # Sentinel: flush whatever is queued, then stop the sender
+            self._out_queue.put_nowait(None)
+            try:
+                await self._sender_task
+            except Exception as error:
+                print(f"⚠️ Failed to flush queued summaries: {error}")
+            self._sender_task = None
+            self._out_queue = None
+        results = await asyncio.gather(
+            *(fetch_client.disconnect() for fetch_client in self._fetch_clients),
+            return_exceptions=True,
+        )
+        for error in results:
+            if isinstance(error, Exception):
+                print(f"⚠️ Failed to disconnect fetch client: {error}")
+        self._fetch_clients = []
+        self._fetch_pool = None
+        self._connected = False
         if self.client:
-            await self.client.disconnect()
+            client, self.client = self.client, None
+            await client.disconnect()
             print("👋 Disconnected from Claude")
 
-    async def _collect_response_text(
+    async def _stream_response(
+        self, client: ClaudeSDKClient | None = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Yield ``("text", str)`` and ``("tool_result", payload)`` items as they arrive."""
+        from claude_agent_sdk import AssistantMessage, ToolResultBlock
+
+        client = client or self.client
+        async for message in client.receive_response():
+            content = getattr(message, "content", None)
+            if not isinstance(content, list):
+                continue
+            for block in content:
+                if isinstance(block, ToolResultBlock):
+                    if block.content:
+                        yield "tool_result", block.content
+                elif isinstance(message, AssistantMessage) and getattr(block, "text", None):
+                    yield "text", block.text
+
+    async def _consume_response(
         self,
+        on_item: Callable[[str, Any], None],
         timeout: float | None = None,
-    ) -> Tuple[str, List[Any]]:
-        """Collect text content from Claude's response with a timeout.
-
-        Returns a tuple of the concatenated text blocks and the raw message objects
-        for callers that need additional metadata.
+        client: ClaudeSDKClient | None = None,
+    ) -> bool:
+        """Feed each streamed response item to ``on_item``, bounded by a timeout.
+
+        Returns False when the response timed out; items handled before that
+        point are kept by the caller. Other errors propagate so the caller's
+        cycle fails and the session is replaced. If the surrounding task is
+        cancelled the in-flight turn is interrupted before re-raising, so a
+        pooled session is not handed back mid-response.
         """
-
-        if not self.client:
-            return "", []
+        client = client or self.client
+        if not client:
+            return False
 
         effective_timeout = timeout or self.response_timeout
 
-        async def _consume() -> List[Any]:
-            collected: List[Any] = []
-            async for message in self.client.receive_response():
-                collected.append(message)
-            return collected
-
         try:
-            messages = await asyncio.wait_for(_consume(), effective_timeout)
-        except asyncio.TimeoutError:
+            async with asyncio.timeout(effective_timeout):
+                async for kind, payload in self._stream_response(client):
+                    on_item(kind, payload)
+        except TimeoutError:
             print(
                 f"⚠️ Timeout waiting for Claude response after {effective_timeout:.0f}s"
             )
-            try:
-                await self.client.interrupt()
-            except Exception as interrupt_error:
-                print(f"⚠️ Failed to interrupt Claude: {interrupt_error}")
-            return "", []
-        except Exception as error:
-            print(f"❌ Error receiving Claude response: {error}")
-            return "", []
+            await self._interrupt(client)
+            return False
+        except asyncio.CancelledError:
+            await self._interrupt(client)
+            raise
+        return True
+
+    @staticmethod
+    async def _interrupt(client: ClaudeSDKClient) -> None:
+        """Best-effort interrupt of the turn in flight on ``client``."""
+        try:
+            await client.interrupt()
+        except Exception as interrupt_error:
+            print(f"⚠️ Failed to interrupt Claude: {interrupt_error}")
 
-        text_chunks: List[str] = []
-        for message in messages:
-            if isinstance(message, AssistantMessage):
-                for block in getattr(message, "content", []):
-                    if hasattr(block, "text") and block.text:
-                        text_chunks.append(block.text)
+    async def _collect_response_text(
+        self,
+        timeout: float | None = None,
+        client: ClaudeSDKClient | None = None,
+    ) -> str:
+        """Collect the text content of Claude's response with a timeout.
+
+        ``client`` defaults to the main session; pooled fetch sessions pass their own.
+        """
+        chunks: List[str] = []
+
+        def _on_item(kind: str, payload: Any) -> None:
+            if kind == "text":
+                chunks.append(payload)
 
-        return "".join(text_chunks), messages
+        if not await self._consume_response(_on_item, timeout, client):
+            return ""
+        return "".join(chunks)
 
     async def get_channels(self) -> List[Dict[str, Any]]:
         """Get list of Slack channels"""
@@ -219,168 +531,656 @@ Be concise and focus on actionable insights."""
         )
 
         channels = []
-        _, messages = await self._collect_response_text()
 
-        for message in messages:
-            if isinstance(message, AssistantMessage):
-                for block in getattr(message, "content", []):
-                    if isinstance(block, ToolResultBlock):
-                        # TODO: Parse channel data from tool result if needed
-                        pass
+        def _on_item(kind: str, payload: Any) -> None:
+            # TODO: Parse channel data from tool result if needed
+            pass
+
+        await self._consume_response(_on_item)
 
         return channels
 
+    async def _resolve_channel_ids(self, names: List[str]) -> Dict[str, str]:
+        """Map channel names to IDs, only asking Slack about cache misses."""
+        now = time.monotonic()
+        resolved: Dict[str, str] = {}
+        misses: List[str] = []
+
+        for name in names:
+            key = name.lstrip("#")
+            if _CHANNEL_ID_RE.match(key):
+                resolved[name] = key
+                continue
+            cached = self._channel_cache.get(key)
+            if cached and now - cached[1] < self._channel_cache_ttl:
+                resolved[name] = cached[0]
+            else:
+                misses.append(name)
+
+        if misses:
+            await self.client.query(_CHANNEL_LOOKUP_QUERY_PREFIX + ", ".join(misses))
+            response = await self._collect_response_text()
+            resolved_at = time.monotonic()
+            for match in _CHANNEL_MAPPING_RE.finditer(response):
+                self._channel_cache[match.group(1)] = (match.group(2), resolved_at)
+            self._save_channel_cache()
+
+            for name in misses:
+                cached = self._channel_cache.get(name.lstrip("#"))
+                # Fall back to the name so Claude can still try to resolve it
+                resolved[name] = cached[0] if cached else name
+
+        return resolved
+
+    async def refresh_channel_cache(self) -> Dict[str, str]:
+        """Drop cached channel IDs and resolve the monitored channels again."""
+        self._channel_cache.clear()
+        return await self._resolve_channel_ids(self.channels_to_monitor)
+
+    def _load_channel_cache(self) -> None:
+        """Seed the channel cache from disk; entries count as resolved at startup."""
+        if not self._channel_cache_file:
+            return
+        try:
+            mapping = _json_loads(self._channel_cache_file.read_bytes())
+        except (OSError, ValueError):
+            return
+        if not isinstance(mapping, dict):
+            return
+        loaded_at = time.monotonic()
+        for name, channel_id in mapping.items():
+            if isinstance(channel_id, str) and _CHANNEL_ID_RE.match(channel_id):
+                self._channel_cache[name] = (channel_id, loaded_at)
+
+    def _save_channel_cache(self) -> None:
+        """Persist name -> ID mappings so the next run can skip the lookup query."""
+        if not self._channel_cache_file:
+            return
+        mapping = {name: channel_id for name, (channel_id, _) in self._channel_cache.items()}
+        try:
+            if not self._channel_cache_dir_ready:
+                self._channel_cache_file.parent.mkdir(parents=True, exist_ok=True)
+                self._channel_cache_dir_ready = True
+            tmp_path = self._channel_cache_file.with_suffix(".tmp")
+            tmp_path.write_text(_json_dumps(mapping), encoding="utf-8")
+            os.replace(tmp_path, self._channel_cache_file)
+        except OSError as error:
+            print(f"⚠️ Could not persist channel cache: {error}")
+
+    def _load_last_check(self) -> None:
+        """Resume the message window from the previous run's last check, at most _max_interval back."""
+        if not self._last_check_file:
+            return
+        try:
+            saved = _json_loads(self._last_check_file.read_bytes())
+            last_check = float(saved["last_check"])
+        except (OSError, ValueError, TypeError, KeyError):
+            return
+        elapsed = min(max(0.0, time.time() - last_check), self._max_interval)
+        if elapsed > self.check_interval:
+            self.last_check_time = datetime.now() - timedelta(seconds=elapsed)
+            self._last_check_mono = time.monotonic() - elapsed
+
+    def _save_last_check(self) -> None:
+        """Persist the start time of the check that just completed (its window end)."""
+        if not self._last_check_file:
+            return
+        try:
+            if not self._last_check_dir_ready:
+                self._last_check_file.parent.mkdir(parents=True, exist_ok=True)
+                self._last_check_dir_ready = True
+            tmp_path = self._last_check_file.with_suffix(".tmp")
+            payload = {"last_check": self.last_check_time.timestamp()}
+            tmp_path.write_text(_json_dumps(payload), encoding="utf-8")
+            os.replace(tmp_path, self._last_check_file)
+        except OSError as error:
+            print(f"⚠️ Could not persist last check time: {error}")
+
+    async def _fetch_channel_history(
+        self,
+        channel: str,
+        channel_id: str,
+        minutes_ago: int,
+    ) -> List[Dict[str, str]]:
+        """Fetch recent messages for a single channel using a pooled session."""
+        if not self._fetch_pool:
+            raise RuntimeError("Client not connected. Call connect() first.")
+
+        text_chunks: List[str] = []
+        extracted: List[Dict[str, str]] = []
+
+        def _on_item(kind: str, payload: Any) -> None:
+            # Parse tool payloads as they stream in, while Claude is still generating
+            if kind == "tool_result":
+                extracted.extend(self._parse_tool_payload(payload))
+            else:
+                text_chunks.append(payload)
+
+        client = await self._fetch_pool.get()
+        try:
+            await client.query(
+                f"{_HISTORY_QUERY_PREFIX}Channel: {channel_id}\nLook for messages from the last {minutes_ago} minutes."
+            )
+            completed = await self._consume_response(_on_item, client=client)
+        finally:
+            self._fetch_pool.put_nowait(client)
+        if not completed:
+            # A partial page must not pass for a complete one (the window would skip the rest)
+            raise TimeoutError(f"History fetch for {channel} timed out")
+
+        history = "".join(text_chunks)
+        if "not_found" in history:
+            # Channel was renamed/deleted; resolve it again next cycle
+            if self._channel_cache.pop(channel.lstrip("#"), None):
+                self._save_channel_cache()
+            return []
+
+        # Prefer the structured tool payload; fall back to Claude's rendered lines
+        return extracted or [
+            {"ts": ts, "user": user, "text": text} for ts, user, text in _HISTORY_LINE_RE.findall(history)
+        ]
+
+    @staticmethod
+    def _parse_tool_payload(payload_text: Any) -> List[Dict[str, str]]:
+        """Pull Slack messages straight out of a JSON tool result, if present."""
+        if isinstance(payload_text, list):
+            payload_text = "".join(
+                item.get("text", "") for item in payload_text if isinstance(item, dict)
+            )
+        try:
+            payload = _json_loads(payload_text)
+        except ValueError:
+            return []
+        if not isinstance(payload, dict):
+            return []
+        return [
+            {
+                "ts": str(item["ts"]),
+                "user": str(item.get("user") or ""),
+                "text": str(item["text"]),
+            }
+            for item in payload.get("messages") or []
+            if isinstance(item, dict) and item.get("ts") and item.get("text")
+        ]
+
+    def _evict_seen_messages(self) -> None:
+        """Forget message IDs not fetched for two (current) check intervals, oldest first."""
+        cutoff = time.monotonic() - 2 * self._current_interval
+        while len(self.seen_messages) > _SEEN_MESSAGES_MAX:
+            self.seen_messages.popitem(last=False)
+        while self.seen_messages:
+            _, first_seen = next(iter(self.seen_messages.items()))
+            if first_seen >= cutoff:
+                break
+            self.seen_messages.popitem(last=False)
+
+    def _filter_unseen(self, channel: str, entries: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """Keep only messages not analyzed in a previous cycle (see _mark_seen)."""
+        now = time.monotonic()
+        unseen: List[Dict[str, str]] = []
+        for entry in entries:
+            key = f"{channel}:{entry['ts']}"
+            if key in self.seen_messages:
+                # Still inside the fetch window: refresh so it is not evicted and re-analyzed
+                self.seen_messages.move_to_end(key)
+                self.seen_messages[key] = now
+                continue
+            unseen.append(entry)
+        return unseen
+
+    def _mark_seen(self, candidates: Dict[str, List[Dict[str, str]]]) -> None:
+        """Remember messages that were classified, so later cycles skip them."""
+        now = time.monotonic()
+        for channel, entries in candidates.items():
+            for entry in entries:
+                self.seen_messages[f"{channel}:{entry['ts']}"] = now
+
+    def _prefilter(self, message: Dict[str, str]) -> bool:
+        """Cheap Python screen deciding whether a message is worth an LLM look."""
+        text = message.get("text", "")
+        if self._has_keyword(text):
+            return True
+        return _PREFILTER_RE.search(text) is not None
+
+    def _has_keyword(self, text: str) -> bool:
+        """Return True if any configured keyword occurs in text (case-insensitive)."""
+        if self._kw_automaton is not None:
+            return next(self._kw_automaton.iter(text.lower()), None) is not None
+        if self._keyword_re is not None:
+            return self._keyword_re.search(text) is not None
+        return False
+
+    async def _analyze(self, candidates: Dict[str, List[Dict[str, str]]]) -> str:
+        """Classify pre-screened candidate messages with a single Claude query."""
+        payload = [
+            {"channel": channel, "user": msg["user"], "ts": msg["ts"], "text": msg["text"]}
+            for channel, entries in candidates.items()
+            for msg in entries
+        ]
+        await self.client.query(_CLASSIFY_QUERY_PREFIX + _json_dumps(payload))
+        analysis = await self._collect_response_text()
+        return analysis
+
+    @staticmethod
+    def _parse_classification(
+        analysis: str,
+        candidates: Dict[str, List[Dict[str, str]]],
+    ) -> List[SlackMessage] | None:
+        """Turn Claude's JSON classification into SlackMessage objects (None if not JSON)."""
+        cleaned = analysis.strip()
+        if cleaned.startswith("```"):
+            cleaned = cleaned.strip("`").strip().removeprefix("json")
+        try:
+            parsed = _json_loads(cleaned)
+        except ValueError:
+            return None
+        if not isinstance(parsed, list):
+            return None
+
+        texts = {
+            (channel, msg["ts"]): msg["text"]
+            for channel, entries in candidates.items()
+            for msg in entries
+        }
+        messages: List[SlackMessage] = []
+        for item in parsed:
+            if not isinstance(item, dict):
+                continue
+            channel = str(item.get("channel", ""))
+            ts = str(item.get("ts", ""))
+            importance = str(item.get("importance", "NORMAL")).upper()
+            messages.append(
+                SlackMessage(
+                    channel=channel,
+                    user=str(item.get("user", "")),
+                    text=texts.get((channel, ts), ""),
+                    timestamp=ts,
+                    importance=importance if importance in _IMPORTANCE_LEVELS else "NORMAL",
+                    reason=str(item.get("reason", "")),
+                )
+            )
+        return messages
+
+    @staticmethod
+    def _format_classification(messages: List[SlackMessage]) -> str:
+        """Render parsed classifications as a readable summary."""
+        relevant = [msg for msg in messages if msg.importance != "IGNORE"]
+        if not relevant:
+            return "No important messages found."
+        icons = {"CRITICAL": "🚨", "IMPORTANT": "⚠️", "NORMAL": "ℹ️"}
+        lines: List[str] = []
+        for msg in relevant:
+            lines.append(f"{icons.get(msg.importance, '•')} [{msg.importance}] #{msg.channel} · {msg.user}: {msg.text}")
+            if msg.reason:
+                lines.append(f"   • {msg.reason}")
+        return "\n".join(lines)
+
+    async def _classify(
+        self,
+        candidates: Dict[str, List[Dict[str, str]]],
+    ) -> Tuple[str, List[SlackMessage]]:
+        """Run the analysis query and return (printable summary, parsed messages)."""
+        analysis = await self._analyze(candidates)
+        parsed = self._parse_classification(analysis, candidates)
+        if parsed is None:
+            # Claude did not return JSON; fall back to its free-form text
+            return analysis, []
+        return self._format_classification(parsed), parsed
+
     async def check_messages(self) -> List[SlackMessage]:
         """Check for new messages in monitored channels"""
         if not self.client:
             raise RuntimeError("Client not connected. Call connect() first.")
 
         messages: List[SlackMessage] = []
+        self._evict_seen_messages()
 
         # Calculate time window
-        minutes_ago = int((datetime.now() - self.last_check_time).total_seconds() / 60)
+        now = datetime.now()
+        now_mono = time.monotonic()
+        minutes_ago = max(1, int((now_mono - self._last_check_mono) / 60))
 
-        # Build query based on channels to monitor
-        # NOTE: Keywords are no longer used - focus on channel-specific patterns and recurrence
         if self.channels_to_monitor:
-            channel_list = ", ".join(self.channels_to_monitor)
-            query = f"""USE the Slack MCP tools to check messages from the following channels: {channel_list}
-
-IMPORTANT: You must use the mcp__slack__conversations_history tool to fetch actual messages from each channel.
-
-Look for messages from the last {minutes_ago} minutes.
-
-For each message you find, analyze based on channel context and provide:
-1. Channel name
-2. User who sent it
-3. Message text
-4. Importance level (CRITICAL, IMPORTANT, NORMAL, IGNORE)
-5. Brief reason why it's important or can be ignored
+            # Resolve names to IDs up front (cached) so fetches skip channels_list
+            channel_ids = await self._resolve_channel_ids(self.channels_to_monitor)
 
-IMPORTANT: Classification should be based on message content, context, and channel-specific rules.
-Do NOT rely solely on keywords - understand the actual meaning and urgency.
-
-If no important messages are found, say so clearly."""
+            # Fan out one history fetch per channel so latency is max() instead of sum().
+            # The fetches share one deadline, and the first failure cancels the rest.
+            try:
+                async with asyncio.timeout(self.response_timeout), asyncio.TaskGroup() as group:
+                    tasks = [
+                        group.create_task(
+                            self._fetch_channel_history(channel, channel_ids[channel], minutes_ago)
+                        )
+                        for channel in self.channels_to_monitor
+                    ]
+            except TimeoutError:
+                print(f"⚠️ Channel fetches exceeded {self.response_timeout:.0f}s; skipping this cycle")
+                return messages
+            except ExceptionGroup as errors:
+                timeouts, failures = errors.split(TimeoutError)
+                if failures is not None:
+                    raise failures.exceptions[0]
+                print(f"⚠️ {timeouts.exceptions[0]}; skipping this cycle")
+                return messages
+
+            # Only new messages passing the Python prefilter reach the LLM
+            candidates: Dict[str, List[Dict[str, str]]] = {}
+            for channel, task in zip(self.channels_to_monitor, tasks):
+                result = task.result()
+                selected = [msg for msg in self._filter_unseen(channel, result) if self._prefilter(msg)]
+                if selected:
+                    candidates[channel] = selected
+
+            if not candidates:
+                # Nothing to analyze, so the window can move on right away
+                self.last_check_time = now
+                self._last_check_mono = now_mono
+                self._save_last_check()
+                self._current_interval = min(self._max_interval, self._current_interval * 2)
+                print("ℹ️ No candidate messages in monitored channels")
+                return messages
+
+            self._current_interval = self._min_interval
+            current_analysis, messages = await self._classify(candidates)
+            if not current_analysis.strip():
+                # Timed out (or no reply): leave the candidates unseen and the window
+                # where it is, so the next cycle analyzes them again
+                print("⚠️ No analysis received from Claude; skipping this cycle")
+                return messages
+            self._mark_seen(candidates)
+
+            # Update last check time only once the analysis succeeded, so a failed
+            # cycle is retried over the same window
+            self.last_check_time = now
+            self._last_check_mono = now_mono
+            self._save_last_check()
         else:
             # Fallback: Monitor all channels (no keyword filtering)
-            query = f"""USE the Slack MCP tools to check for recent messages across all channels.
+            keywords = tuple(self.keywords)
+            if keywords != self._last_cycle_keywords:
+                self._last_cycle_keywords = keywords
+                self._cycles_empty_in_row = 0
+            quiet_for = self.check_interval * min(self._cycles_empty_in_row, 8)
+            if self._cycles_empty_in_row and now_mono - self._last_cycle_ts < quiet_for:
+                # The window keeps growing, so skipped minutes are covered next time
+                print("ℹ️ Workspace quiet; skipping all-channels search this cycle")
+                return messages
+
+            await self.client.query(
+                f"{_ALL_CHANNELS_QUERY_PREFIX}Look for messages from the last {minutes_ago} minutes."
+            )
 
-IMPORTANT: You must use the mcp__slack__conversations_history tool to fetch messages.
+            current_analysis = await self._collect_response_text()
+            if not current_analysis.strip():
+                # Timed out or no reply: not a quiet cycle, so keep the window and the
+                # empty-cycle streak as they are and search the same span again
+                print("⚠️ No analysis received from Claude; skipping this cycle")
+                return messages
+
+            # Update last check time
+            self.last_check_time = now
+            self._last_check_mono = now_mono
+            self._save_last_check()
+            self._last_cycle_ts = now_mono
+            if _ACTIONABLE_RE.search(current_analysis):
+                self._cycles_empty_in_row = 0
+            else:
+                self._cycles_empty_in_row += 1
 
-Look for messages from the last {minutes_ago} minutes.
+            # Nothing found: skip the report so no summary post (another Claude turn) follows
+            if current_analysis.strip().strip(".").upper() == _NO_MESSAGES_REPLY:
+                print("ℹ️ No new messages across channels")
+                return messages
 
-For each message, analyze based on content and context:
-1. Channel name
-2. User who sent it
-3. Message text
-4. Importance level (CRITICAL, IMPORTANT, NORMAL, IGNORE)
-5. Brief reason
+        await self._report_analysis(current_analysis, now)
+        return messages
 
-Focus on actual urgency and meaning, not just keywords.
+    async def _report_analysis(self, analysis: str, now: datetime | None = None) -> None:
+        """Print an analysis and forward it to the summary channel if configured."""
+        now = now or datetime.now()
+        print("\n" + "="*80)
+        print(f"📊 Slack Analysis ({now.strftime('%Y-%m-%d %H:%M:%S')})")
+        print("="*80)
+        print(analysis)
+        print("="*80 + "\n")
 
-If no messages are found, say so clearly."""
+        # Send summary to Slack if configured
+        if self.summary_channel and analysis.strip():
+            await self._send_summary_to_slack(analysis, now)
 
-        await self.client.query(query)
+    async def _run_socket_mode(self) -> None:
+        """Receive messages pushed by Slack Socket Mode instead of polling."""
+        from slack_sdk.socket_mode.aiohttp import SocketModeClient
+        from slack_sdk.web.async_client import AsyncWebClient
 
-        current_analysis, _ = await self._collect_response_text()
+        app_token = os.getenv("SLACK_APP_TOKEN")
+        if not app_token:
+            raise RuntimeError("SLACK_APP_TOKEN is required for Socket Mode")
 
-        # Update last check time
-        self.last_check_time = datetime.now()
+        channel_ids = await self._resolve_channel_ids(self.channels_to_monitor)
+        self._monitored_ids = {channel_id: name for name, channel_id in channel_ids.items()}
 
-        if not current_analysis.strip():
-            print("⚠️ No analysis received from Claude; skipping this cycle")
-            return messages
+        bot_token = os.getenv("SLACK_BOT_TOKEN") or os.getenv("SLACK_MCP_XOXP_TOKEN")
+        socket_client = SocketModeClient(app_token=app_token, web_client=AsyncWebClient(token=bot_token))
+        socket_client.socket_mode_request_listeners.append(self._on_event)
 
-        # Parse Claude's analysis into SlackMessage objects
-        # This is simplified - you may want more robust parsing
-        print("\n" + "="*80)
-        print(f"📊 Slack Analysis ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})")
-        print("="*80)
-        print(current_analysis)
-        print("="*80 + "\n")
+        await socket_client.connect()
+        print("✅ Listening for Slack events via Socket Mode")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await socket_client.close()
 
-        # Send summary to Slack if configured
-        if self.summary_channel and current_analysis.strip():
-            await self._send_summary_to_slack(current_analysis)
+    async def _on_event(self, socket_client, request) -> None:
+        """Analyze a single pushed Slack message if it passes dedup and the prefilter."""
+        from slack_sdk.socket_mode.response import SocketModeResponse
 
-        return messages
+        if request.type != "events_api":
+            return
+        # Acknowledge first so Slack does not redeliver while we analyze
+        await socket_client.send_socket_mode_response(SocketModeResponse(envelope_id=request.envelope_id))
 
-    async def _send_summary_to_slack(self, analysis: str):
-        """Send analysis summary to configured Slack channel"""
-        if not self.client:
+        event = (request.payload or {}).get("event") or {}
+        if event.get("type") != "message" or event.get("subtype"):
+            return
+        channel_id = event.get("channel")
+        if self._monitored_ids and channel_id not in self._monitored_ids:
+            return
+
+        channel = self._monitored_ids.get(channel_id, channel_id)
+        entry = {"ts": str(event.get("ts", "")), "user": str(event.get("user") or ""), "text": event.get("text", "")}
+        unseen = self._filter_unseen(channel, [entry])
+        if not unseen or not self._prefilter(entry):
             return
 
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        try:
+            # The main session carries one conversation at a time
+            async with self._event_lock:
+                # A redelivered copy may have been analyzed while this one waited
+                if not self._filter_unseen(channel, unseen):
+                    return
+                analysis, _ = await self._classify({channel: unseen})
+                if not analysis.strip():
+                    # Already acked, so Slack will not redeliver; at least leave a trace
+                    print(f"⚠️ No analysis received for {channel} message {entry['ts']}; skipped")
+                    return
+                self._mark_seen({channel: unseen})
+                await self._report_analysis(analysis)
+        except Exception as e:
+            print(f"❌ Error analyzing Slack event: {e}")
+
+    async def _send_summary_to_slack(self, analysis: str, now: datetime | None = None):
+        """Send analysis summary to configured Slack channel"""
+        timestamp = (now or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')
         message = f"""📊 *Análise de Alertas - {timestamp}*
 
 {analysis}
 
 _Gerado automaticamente pelo Monitor de Slack_"""
 
-        query = f"""USE the mcp__slack__conversations_add_message tool RIGHT NOW to send a message to the channel '{self.summary_channel}'.
-
-IMPORTANT: Do NOT check if the channel exists first. Just send the message directly.
+        if self._out_queue is not None:
+            await self._out_queue.put((self.summary_channel, message))
+            return
+        if self._web is not None:
+            await self._post_summary_direct(self.summary_channel, message)
+            return
 
-Send this exact message:
-{message}
+        if not self.client:
+            return
 
-Use the channel name '{self.summary_channel}'. If you get an error, show me the EXACT error message."""
+        query = f"{_POST_QUERY_PREFIX}Channel: '{self.summary_channel}'\n\nSend this exact message:\n{message}"
 
         try:
             await self.client.query(query)
 
-            full_response, _ = await self._collect_response_text()
+            full_response = await self._collect_response_text()
 
             # Debug: show what Claude actually said
             print(f"\n🔍 Claude's response to posting summary:")
             print(full_response)
             print("="*80)
 
-            if "error" in full_response.lower() or "failed" in full_response.lower() or "not found" in full_response.lower():
+            status = _RESPONSE_STATUS_RE.search(full_response)
+            if status and status.group("err"):
                 print(f"⚠️  Error detected in response!")
-            elif "success" in full_response.lower() or "sent" in full_response.lower() or "posted" in full_response.lower():
+            elif status and status.group("ok"):
                 print(f"✅ Summary sent to #{self.summary_channel}")
             else:
                 print(f"⚠️  Unclear response - check above")
         except Exception as e:
             print(f"❌ Failed to send summary to Slack: {e}")
 
+    async def _sender_loop(self):
+        """Coalesce queued summaries per channel and post them in batches.
+
+        Summaries arriving within ``summary_flush_interval`` of the first one
+        are joined into a single chat.postMessage per channel, keeping posts
+        under Slack's one-message-per-second channel limit. A ``None`` item
+        flushes the pending batch and stops the loop.
+        """
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await self._out_queue.get()
+            if first is None:
+                break
+            batch: Dict[str, List[str]] = {first[0]: [first[1]]}
+            deadline = loop.time() + self.summary_flush_interval
+            try:
+                async with asyncio.timeout_at(deadline):
+                    while True:
+                        item = await self._out_queue.get()
+                        if item is None:
+                            stopping = True
+                            break
+                        batch.setdefault(item[0], []).append(item[1])
+            except TimeoutError:
+                pass
+
+            for channel, texts in batch.items():
+                await self._post_summary_direct(channel, "\n\n---\n\n".join(texts))
+
+    async def _post_summary_direct(self, channel: str, message: str, attempts: int = 2):
+        """Post the summary with chat.postMessage, waiting out Slack rate limits."""
+        from slack_sdk.errors import SlackApiError
+
+        for attempt in range(attempts):
+            try:
+                response = await self._web.chat_postMessage(
+                    channel=channel, text=message, mrkdwn=True
+                )
+            except SlackApiError as e:
+                error = e.response.get("error", str(e))
+                if error == "ratelimited" and attempt + 1 < attempts:
+                    retry_after = int(e.response.headers.get("Retry-After", 1))
+                    print(f"⏳ Rate limited posting summary; retrying in {retry_after}s")
+                    await asyncio.sleep(retry_after)
+                    continue
+                print(f"❌ Failed to send summary to Slack: {error}")
+                return
+            except Exception as e:
+                print(f"❌ Failed to send summary to Slack: {e}")
+                return
+
+            if response.get("ok"):
+                print(f"✅ Summary sent to #{channel}")
+            else:
+                print(f"⚠️  Slack rejected summary: {response.get('error')}")
+            return
+
     async def monitor_continuously(self):
         """Continuously monitor Slack channels"""
-        print(f"🔍 Starting Slack monitor...")
-        print(f"   Checking every {self.check_interval} seconds")
-        print(f"   Keywords: {', '.join(self.keywords)}")
+        # Build the banner first and emit it with a single write
+        lines = ["🔍 Starting Slack monitor..."]
+        if self.use_socket_mode:
+            lines.append("   Receiving events via Socket Mode")
+        else:
+            lines.append(f"   Checking every {self.check_interval} seconds")
+        lines.append(f"   Keywords: {', '.join(self.keywords)}")
         if self.channels_to_monitor:
-            print(f"   Channels: {', '.join(self.channels_to_monitor)}")
+            lines.append(f"   Channels: {', '.join(self.channels_to_monitor)}")
         else:
-            print(f"   Monitoring: All channels with keywords")
+            lines.append("   Monitoring: All channels with keywords")
         if self.summary_channel:
-            print(f"   📤 Sending summaries to: #{self.summary_channel}")
-        print()
+            lines.append(f"   📤 Sending summaries to: #{self.summary_channel}")
+        print("\n".join(lines) + "\n")
 
         await self.connect()
 
         try:
+            if self.use_socket_mode:
+                await self._run_socket_mode()
+                return
+
             while True:
                 try:
+                    await self.ensure_connected()
                     await self.check_messages()
-                    await asyncio.sleep(self.check_interval)
+                    await asyncio.sleep(self._current_interval)
                 except KeyboardInterrupt:
                     break
                 except Exception as e:
                     print(f"❌ Error checking messages: {e}")
-                    await asyncio.sleep(self.check_interval)
+                    # Force a fresh MCP session on the next cycle
+                    self._connected = False
+                    await asyncio.sleep(self._retry_delay(e))
         finally:
             await self.disconnect()
 
+    def _retry_delay(self, error: Exception) -> float:
+        """Seconds to wait after a failed cycle, honoring Slack rate limits."""
+        if not _RATE_LIMIT_RE.search(str(error)):
+            return self._current_interval
+
+        self._current_interval = min(self._max_interval, self._current_interval * 2)
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or {}
+        try:
+            retry_after = int(headers.get("Retry-After", self._current_interval))
+        except (TypeError, ValueError):
+            retry_after = self._current_interval
+        print(f"⏳ Rate limited by Slack; retrying in {retry_after}s")
+        return retry_after
+
     async def check_once(self):
-        """Check messages once and exit"""
+        """Check messages once and exit.
+
+        Inside ``async with SlackMonitor(...) as monitor`` the open session is
+        reused, so repeated calls skip the MCP subprocess handshake.
+        """
+        if self._connected:
+            return await self.check_messages()
+
         await self.connect()
         try:
             messages = await self.check_messages()
             return messages
         finally:
             await self.disconnect()
+            # One-shot run: drop the cached options (MCP config + rendered prompt)
+            # so an embedding process does not keep them alive until GC
+            self._options = None
 
 
 async def main():
@@ -411,7 +1211,9 @@ async def main():
         keywords=IMPORTANCE_KEYWORDS,
         check_interval=CHECK_INTERVAL,
         mcp_server_config=SLACK_MCP_CONFIG,
-        summary_channel=SUMMARY_CHANNEL
+        summary_channel=SUMMARY_CHANNEL,
+        channel_cache_file=_CHANNEL_CACHE_FILE,
+        last_check_file=_LAST_CHECK_FILE,
     )
 
     # Run continuously
@@ -422,4 +1224,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - optional dependency
+        asyncio.run(main())
+    else:
+        # libuv-backed loop: cheaper scheduling for the MCP/Slack I/O fan-out
+        uvloop.run(main())
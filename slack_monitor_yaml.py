@@ -6,14 +6,39 @@ Monitors channels starting with specific prefixes (e.g., cslog-alertas*)
 
 import asyncio
 import sys
-from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from slack_monitor import SlackMonitor
 from advanced_example import AdvancedSlackMonitor
 from config_loader import load_config, Config
 
 
+_PROMPT_TEMPLATE = """Você é um analisador de mensagens do Slack que ajuda a filtrar mensagens importantes.
+
+Seu trabalho é analisar mensagens do Slack e determinar quais precisam de atenção imediata.
+
+CANAIS A MONITORAR: {channels}
+
+IMPORTANTE: Apenas analise mensagens dos canais especificados acima. Ignore mensagens de outros canais.
+
+Considere uma mensagem importante se:
+1. Contiver palavras-chave urgentes: {keywords}
+2. Fizer perguntas diretas ao usuário
+3. Reportar erros, incidentes ou falhas de sistema
+4. Solicitar ação ou aprovação imediata
+5. Contiver menções ou mensagens diretas
+6. Reportar métricas críticas de negócio ou alertas
+
+Para cada mensagem, classifique como:
+- CRÍTICO: Precisa de atenção imediata
+- IMPORTANTE: Deve ser revisado em breve
+- NORMAL: Pode ser revisado depois
+- IGNORAR: Não relevante ou spam
+
+Seja conciso e focado em insights acionáveis.
+"""
+
+
 class YamlSlackMonitor:
     """Slack Monitor configured from YAML file"""
 
@@ -29,6 +54,8 @@ class YamlSlackMonitor:
         self.use_advanced = use_advanced
         self.monitor = None
 
+        self._system_prompt: Optional[str] = None
+
     def _expand_channel_patterns(self, channels: List[str]) -> str:
         """
         Convert channel patterns to Slack search query
@@ -57,53 +84,33 @@ class YamlSlackMonitor:
 
     def _create_system_prompt(self) -> str:
         """Create system prompt with Portuguese keywords and custom rules"""
-        keywords_str = ", ".join(self.config.keywords)
-        channel_pattern = self.config.get_channel_pattern()
-
-        base_prompt = f"""Você é um analisador de mensagens do Slack que ajuda a filtrar mensagens importantes.
-
-Seu trabalho é analisar mensagens do Slack e determinar quais precisam de atenção imediata.
-
-CANAIS A MONITORAR: {channel_pattern}
-
-IMPORTANTE: Apenas analise mensagens dos canais especificados acima. Ignore mensagens de outros canais.
-
-Considere uma mensagem importante se:
-1. Contiver palavras-chave urgentes: {keywords_str}
-2. Fizer perguntas diretas ao usuário
-3. Reportar erros, incidentes ou falhas de sistema
-4. Solicitar ação ou aprovação imediata
-5. Contiver menções ou mensagens diretas
-6. Reportar métricas críticas de negócio ou alertas
-
-Para cada mensagem, classifique como:
-- CRÍTICO: Precisa de atenção imediata
-- IMPORTANTE: Deve ser revisado em breve
-- NORMAL: Pode ser revisado depois
-- IGNORAR: Não relevante ou spam
-
-Seja conciso e focado em insights acionáveis.
-"""
-
-        # Add custom rules if defined
-        if self.config.importance_rules:
-            base_prompt += f"\n\n{self.config.importance_rules}"
-
-        return base_prompt
+        if self._system_prompt is None:
+            prompt = _PROMPT_TEMPLATE.format(
+                keywords=", ".join(self.config.keywords),
+                channels=self.config.get_channel_pattern(),
+            )
+            # Add custom rules if defined
+            importance_rules = getattr(self.config, "importance_rules", None)
+            if importance_rules:
+                prompt += f"\n\n{importance_rules}"
+            self._system_prompt = prompt
+        return self._system_prompt
 
     async def start(self):
         """Start monitoring"""
 
-        # Print configuration
-        print("🔍 Monitor de Slack - Configuração")
-        print("=" * 60)
-        print(f"📺 Canais: {self.config.get_channel_pattern()}")
-        print(f"🔑 Palavras-chave: {len(self.config.keywords)} configuradas")
-        print(f"⏱️  Intervalo: {self.config.check_interval} segundos")
+        # Print configuration (single write)
+        lines = [
+            "🔍 Monitor de Slack - Configuração",
+            "=" * 60,
+            f"📺 Canais: {self.config.get_channel_pattern()}",
+            f"🔑 Palavras-chave: {len(self.config.keywords)} configuradas",
+            f"⏱️  Intervalo: {self.config.check_interval} segundos",
+        ]
         if self.use_advanced:
-            print(f"🔔 Notificações: {'Ativadas' if self.config.enable_notifications else 'Desativadas'}")
-            print(f"💾 Banco de dados: {self.config.database_path}")
-        print()
+            lines.append(f"🔔 Notificações: {'Ativadas' if self.config.enable_notifications else 'Desativadas'}")
+            lines.append(f"💾 Banco de dados: {self.config.database_path}")
+        print("\n".join(lines) + "\n")
 
         # Create monitor
         monitor_kwargs = {
@@ -127,9 +134,7 @@ Seja conciso e focado em insights acionáveis.
         self.monitor.options.system_prompt = custom_prompt
 
         # Start monitoring
-        print("🚀 Iniciando monitoramento contínuo...")
-        print("   Pressione Ctrl+C para parar")
-        print()
+        print("🚀 Iniciando monitoramento contínuo...\n   Pressione Ctrl+C para parar\n")
 
         await self.monitor.monitor_continuously()
 
@@ -189,8 +194,13 @@ async def main():
 
     args = parser.parse_args()
 
-    # Check if config file exists
-    if not Path(args.config).exists():
+    # Create monitor; a missing file surfaces from the single stat in the loader
+    try:
+        monitor = YamlSlackMonitor(
+            config_file=args.config,
+            use_advanced=not args.basic
+        )
+    except FileNotFoundError:
         print(f"❌ Arquivo de configuração não encontrado: {args.config}")
         print()
         print("Por favor, crie o arquivo config.yaml com:")
@@ -198,12 +208,6 @@ async def main():
         print("  # ou use o config.yaml já existente")
         sys.exit(1)
 
-    # Create monitor
-    monitor = YamlSlackMonitor(
-        config_file=args.config,
-        use_advanced=not args.basic
-    )
-
     # Run
     try:
         if args.once:
@@ -220,4 +224,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - optional dependency
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -3,10 +3,10 @@
 
 from __future__ import annotations
 
-import argparse
 import asyncio
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 try:
     from dotenv import load_dotenv
@@ -14,23 +14,27 @@ except ImportError:  # pragma: no cover - optional dependency
     load_dotenv = None
 
 from monitoring.configuration import ConfigurationError, load_runtime_config
-from monitoring.digest import run_digest
-from monitoring.realtime import run_realtime_monitor
 from monitoring.storage import AlertStore
 
+# argparse and the monitors (with their Slack/HTTP client stacks) are imported
+# where they are used, so --stats/--clear-old and library imports stay light
+if TYPE_CHECKING:
+    import argparse
+
 
 def _load_env() -> None:
     if not load_dotenv:
         return
-    env_path = Path(__file__).parent / ".env"
-    oauth_path = Path(__file__).parent / ".env.oauth"
-    if env_path.exists():
-        load_dotenv(env_path)
-    if oauth_path.exists():
-        load_dotenv(oauth_path)
+    base_dir = Path(__file__).parent
+    # Explicit paths only: the no-argument form walks parent directories via find_dotenv
+    for env_path in (base_dir / ".env", base_dir / ".env.oauth"):
+        if env_path.exists():
+            load_dotenv(env_path)
 
 
 def create_parser() -> argparse.ArgumentParser:
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Slack alert monitoring toolkit",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
@@ -58,19 +62,22 @@ def show_stats(store: AlertStore, hours: int) -> None:
     critical = stats["critical"]
     important = stats["important"]
 
-    print(f"\n📊 Alert Statistics (last {hours}h)")
-    print("=" * 60)
-    print(f"Total alerts:       {total}")
-    print(f"Sent to Slack:      {sent}")
-    print(f"Filtered locally:   {filtered}")
-    print(f"Critical alerts:    {critical}")
-    print(f"Important alerts:   {important}")
+    lines = [
+        f"\n📊 Alert Statistics (last {hours}h)",
+        "=" * 60,
+        f"Total alerts:       {total}",
+        f"Sent to Slack:      {sent}",
+        f"Filtered locally:   {filtered}",
+        f"Critical alerts:    {critical}",
+        f"Important alerts:   {important}",
+    ]
 
     if stats["top_channels"]:
-        print("\nTop channels:")
-        for channel_id, count in stats["top_channels"]:
-            print(f"  • {channel_id}: {count}")
-    print("=" * 60)
+        lines.append("\nTop channels:")
+        lines.extend(f"  • {channel_id}: {count}" for channel_id, count in stats["top_channels"])
+    lines.append("=" * 60)
+    # One write instead of one per line
+    print("\n".join(lines))
 
 
 def clear_old(store: AlertStore, days: int) -> None:
@@ -93,38 +100,47 @@ async def main() -> None:
         print(f"❌ Configuration error: {error}")
         sys.exit(1)
 
-    store = AlertStore(config.database_path)
-
+    # Admin commands only need the alert store, not the monitors
     if args.stats:
-        show_stats(store, hours=max(1, args.hours))
+        show_stats(AlertStore(config.database_path), hours=max(1, args.hours))
         return
 
     if args.clear_old:
-        clear_old(store, days=max(1, args.days))
+        clear_old(AlertStore(config.database_path), days=max(1, args.days))
         return
 
     mode = args.mode
 
-    # Run both monitors concurrently when mode is "both"
-    if mode == "both" and not args.once:
-        print("🔄 Starting realtime monitor and digest generator...")
-        tasks = [
-            asyncio.create_task(run_realtime_monitor(config_path=args.config, once=False)),
-            asyncio.create_task(run_digest(config_path=args.config, once=False)),
-        ]
-        await asyncio.gather(*tasks)
+    from monitoring.digest import run_digest
+    from monitoring.realtime import run_realtime_monitor
 
-    elif mode == "realtime":
+    # Each selected mode is an independent task on the same event loop; in "both"
+    # mode the never-ending realtime loop must not block the digest scheduler
+    tasks = []
+    if mode in {"realtime", "both"}:
         print("🔄 Starting realtime monitor..." if not args.once else "🔍 Running realtime monitor once...")
-        await run_realtime_monitor(config_path=args.config, once=args.once)
-
-    elif mode == "digest":
+        tasks.append(
+            asyncio.create_task(run_realtime_monitor(config_path=args.config, once=args.once, config=config))
+        )
+    if mode in {"digest", "both"}:
         print("📰 Generating digest summary..." if args.once else "📰 Starting digest generator...")
-        await run_digest(config_path=args.config, once=args.once)
+        tasks.append(asyncio.create_task(run_digest(config_path=args.config, once=args.once, config=config)))
+
+    await asyncio.gather(*tasks)
+
+
+def _run(coro) -> None:
+    """Run on uvloop when it is installed, otherwise on the stock event loop."""
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - optional dependency (unavailable on Windows)
+        asyncio.run(coro)
+    else:
+        uvloop.run(coro)
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        _run(main())
     except KeyboardInterrupt:
         print("\n👋 Monitor stopped by user")